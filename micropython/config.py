@@ -7,11 +7,16 @@ functions for relay names and states. Supports automatic state restoration on bo
 Firmware Version: 1.1.1 - Added NAME command reset functionality
 """
 
+import binascii
 import json
-import time
 
 import machine
 
+from micropython import const
+
+# Integer constants are wrapped in const() so mpy-cross can inline them when
+# this module is precompiled (see `make mpy`)
+
 # Board identification
 BOARD_NAME = "Waveshare Pico Relay B"
 BOARD_VERSION = "1.0"
@@ -30,48 +35,53 @@ RELAY_PINS = {
     8: 14,  # Relay 8: GP14
 }
 
-# Reverse mapping for pin to relay number lookups
-PIN_TO_RELAY = {pin: relay for relay, pin in RELAY_PINS.items()}
+# Relays are wired to consecutive pins in reverse order: relay n is GP(22 - n).
+# Pin/relay conversions use this instead of dict lookups.
+RELAY_PIN_BASE = const(22)
 
 # Peripheral pin mappings
-BUZZER_PIN = 6  # GP6 - PWM capable
-RGB_LED_PIN = 13  # GP13 - NeoPixel control
-ONBOARD_LED_PIN = 25  # GP25 - Standard Pico onboard LED
-USER_BUTTON_PIN = 9  # GP9 - User button (if present)
+BUZZER_PIN = const(6)  # GP6 - PWM capable
+RGB_LED_PIN = const(13)  # GP13 - NeoPixel control
+ONBOARD_LED_PIN = const(25)  # GP25 - Standard Pico onboard LED
+USER_BUTTON_PIN = const(9)  # GP9 - User button (if present)
 
 # Relay control constants
-RELAY_ON = 1  # Logic level for relay ON
-RELAY_OFF = 0  # Logic level for relay OFF
-RELAY_COUNT = 8  # Total number of relays
+RELAY_ON = const(1)  # Logic level for relay ON
+RELAY_OFF = const(0)  # Logic level for relay OFF
+RELAY_COUNT = const(8)  # Total number of relays
 
 # Timing constants (in milliseconds)
-RELAY_SETTLE_TIME = 10  # Time to wait after relay state change
-STARTUP_DELAY = 100  # Delay on startup before accepting commands
-COMMAND_TIMEOUT = 5000  # Maximum time to wait for command completion
+RELAY_SETTLE_TIME = const(10)  # Time to wait after relay state change
+STARTUP_DELAY = const(100)  # Delay on startup before accepting commands
+COMMAND_TIMEOUT = const(5000)  # Maximum time to wait for command completion
+# Max delay before deferred config changes hit flash
+CONFIG_COMMIT_INTERVAL = const(2000)
 
 # PWM constants for buzzer
-BUZZER_FREQ_DEFAULT = 1000  # Default buzzer frequency (Hz)
-BUZZER_DUTY_ON = 32768  # 50% duty cycle for buzzer on
-BUZZER_DUTY_OFF = 0  # 0% duty cycle for buzzer off
+BUZZER_FREQ_DEFAULT = const(1000)  # Default buzzer frequency (Hz)
+BUZZER_DUTY_ON = const(32768)  # 50% duty cycle for buzzer on
+BUZZER_DUTY_OFF = const(0)  # 0% duty cycle for buzzer off
 
 # RGB LED constants
-RGB_LED_COUNT = 1  # Number of RGB LEDs
+RGB_LED_COUNT = const(1)  # Number of RGB LEDs
 RGB_BRIGHTNESS = 0.5  # Default brightness (0.0 to 1.0)
 
 # Status LED patterns (for debugging/status indication)
 STATUS_PATTERNS = {
-    "STARTUP": [(100, 100)] * 3,  # 3 quick blinks
-    "READY": [(1000, 1000)],  # Slow heartbeat
-    "ERROR": [(200, 200)] * 5,  # 5 fast blinks
-    "COMMAND": [(50, 50)],  # Quick flash
+    "STARTUP": ((100, 100),) * 3,  # 3 quick blinks
+    "READY": ((1000, 1000),),  # Slow heartbeat
+    "ERROR": ((200, 200),) * 5,  # 5 fast blinks
+    "COMMAND": ((50, 50),),  # Quick flash
 }
 
 # Protocol constants
 PROTOCOL_VERSION = "1.0"
 COMMAND_TERMINATOR = "\n"
 RESPONSE_TERMINATOR = "\n"
-MAX_COMMAND_LENGTH = 64
-MAX_RESPONSE_LENGTH = 64
+# Longest valid command line in bytes: "NAME 8 " plus a 32-character name
+# of four-byte UTF-8 characters
+MAX_COMMAND_LENGTH = const(7 + 32 * 4)
+MAX_RESPONSE_LENGTH = const(64)
 
 # Error codes
 ERROR_CODES = {
@@ -94,26 +104,31 @@ def is_valid_relay_number(relay_num):
     """
     Check if relay number is valid (1-8).
 
+    Callers must pass an int (the protocol parser converts arguments with
+    int() first); non-numeric values raise TypeError.
+
     Args:
         relay_num (int): Relay number to validate
 
     Returns:
         bool: True if relay number is between 1 and 8, False otherwise
     """
-    return isinstance(relay_num, int) and 1 <= relay_num <= RELAY_COUNT
+    return 1 <= relay_num <= RELAY_COUNT
 
 
 def is_valid_pin(pin_num):
     """
     Check if pin number is valid for Raspberry Pi Pico.
 
+    Callers must pass an int; non-numeric values raise TypeError.
+
     Args:
         pin_num (int): GPIO pin number to validate
 
     Returns:
         bool: True if pin number is between 0 and 28, False otherwise
     """
-    return isinstance(pin_num, int) and 0 <= pin_num <= 28
+    return 0 <= pin_num <= 28
 
 
 def get_relay_pin(relay_num):
@@ -127,7 +142,7 @@ def get_relay_pin(relay_num):
         int or None: GPIO pin number if relay is valid, None otherwise
     """
     if is_valid_relay_number(relay_num):
-        return RELAY_PINS[relay_num]
+        return RELAY_PIN_BASE - relay_num
     return None
 
 
@@ -141,17 +156,21 @@ def get_relay_from_pin(pin_num):
     Returns:
         int or None: Relay number (1-8) if pin is a relay pin, None otherwise
     """
-    return PIN_TO_RELAY.get(pin_num)
+    if RELAY_PIN_BASE - RELAY_COUNT <= pin_num < RELAY_PIN_BASE:
+        return RELAY_PIN_BASE - pin_num
+    return None
 
 
 # Debug configuration
-DEBUG = False  # Enable debug output
-DEBUG_SERIAL = False  # Enable serial debug messages
-DEBUG_COMMANDS = False  # Enable command logging
-DEBUG_TIMING = False  # Enable timing debug (verbose)
+# const() folds `if DEBUG:` only inside the module that defines the flag, so
+# protocol.py keeps its own compile-time copies (_DEBUG, _DEBUG_COMMANDS)
+DEBUG = const(False)  # Enable debug output
+DEBUG_SERIAL = const(False)  # Enable serial debug messages
+DEBUG_COMMANDS = const(False)  # Enable command logging
+DEBUG_TIMING = const(False)  # Enable timing debug (verbose)
 
 # Watchdog configuration
-WATCHDOG_TIMEOUT = 10000  # Watchdog timeout in milliseconds
+WATCHDOG_TIMEOUT = const(10000)  # Watchdog timeout in milliseconds
 
 # Board-specific features (can be detected at runtime)
 FEATURES = {
@@ -164,13 +183,65 @@ FEATURES = {
 # Default relay states on startup
 DEFAULT_RELAY_STATE = [RELAY_OFF] * RELAY_COUNT  # All relays off
 
+# Persistent storage
+CONFIG_FILE = "relay_config.json"
+# Saved relay states change far more often than names, so they live in their
+# own one-byte file instead of forcing a JSON rewrite on every SAVE
+STATE_FILE = "relay_state.bin"
+
+# Top-level keys are shortened on disk to keep the file small; the in-memory
+# dictionary always uses the long names
+_DISK_KEYS = (
+    ("names", "n"),
+    ("settings", "s"),
+    ("states_mask", "st"),
+    ("auto_load", "al"),
+)
+
+# Parsed configuration cached in RAM after the first load (see load_relay_config)
+_CONFIG_CACHE = None
+# True when the cached configuration has changes not yet written to flash
+_CONFIG_DIRTY = False
+# CRC32 of the configuration as last read from or written to flash
+_CONFIG_CRC = None
+# Saved states mask as last read from or written to STATE_FILE
+_STATE_MASK = None
+# Relay number -> name dict built by get_all_relay_names(), reset on rename
+_NAMES_INT_CACHE = None
+
+# Prime the JSON module once at import so its lazy initialization is not paid
+# on the first config load/save
+json.dumps(None)
+
+
+def _compute_board_uid():
+    """
+    Read the board's unique ID from hardware and format it as hex.
+
+    Returns:
+        str: 16-character uppercase hex string, or "0000000000000000"
+             if unique_id() fails
+    """
+    try:
+        uid_bytes = machine.unique_id()
+        return "".join([f"{b:02X}" for b in uid_bytes])
+    except Exception:
+        # Fallback if unique_id() fails
+        return "0000000000000000"
+
+
+# The UID cannot change while running, so read and format it once at import
+_BOARD_UID = _compute_board_uid()
+_BOARD_INFO = f"WAVESHARE-PICO-RELAY-B,V{BOARD_VERSION},8CH,UID:{_BOARD_UID}"
+
 
 def get_board_uid():
     """
     Get the unique identifier for this board.
 
     Uses the Raspberry Pi Pico's unique ID to generate a consistent identifier
-    that can be used for device discovery and identification.
+    that can be used for device discovery and identification. The value is
+    computed once at import.
 
     Returns:
         str: 16-character uppercase hex string (e.g., "ECD43B7502A23159")
@@ -178,12 +249,7 @@ def get_board_uid():
     Note:
         Falls back to "0000000000000000" if unique_id() fails
     """
-    try:
-        uid_bytes = machine.unique_id()
-        return "".join([f"{b:02X}" for b in uid_bytes])
-    except Exception:
-        # Fallback if unique_id() fails
-        return "0000000000000000"
+    return _BOARD_UID
 
 
 def get_board_info():
@@ -197,70 +263,199 @@ def get_board_info():
         str: Formatted board info string in format:
              "WAVESHARE-PICO-RELAY-B,V1.0,8CH,UID:XXXXXXXXXXXXXXXX"
     """
-    uid = get_board_uid()
-    return f"WAVESHARE-PICO-RELAY-B,V{BOARD_VERSION},8CH,UID:{uid}"
+    return _BOARD_INFO
+
+
+def _serialize_config(config):
+    """
+    Encode a configuration dictionary in its compact on-disk JSON form.
+
+    Args:
+        config (dict): Configuration dictionary with long key names
+
+    Returns:
+        str: JSON text with short top-level keys and no whitespace
+    """
+    disk = {}
+    for key, short in _DISK_KEYS:
+        if key in config:
+            disk[short] = config[key]
+    return json.dumps(disk, separators=(",", ":"))
 
 
 def load_relay_config():
     """
     Load relay configuration from persistent storage.
 
-    Reads the relay_config.json file from flash storage. If the file doesn't exist
-    or is corrupted, creates a new configuration with default values.
+    Reads the relay_config.json file from flash storage on first use and caches
+    the parsed dictionary in RAM. Subsequent calls return the cached dictionary
+    without touching flash. If the file doesn't exist or is corrupted, creates a
+    new configuration with default values.
 
     Returns:
         dict: Configuration dictionary containing:
-            - names: Dict mapping relay numbers (as strings) to custom names
+            - names: List of custom names, index 0 = relay 1
             - settings: Dict with auto_save flag and timestamps
-            - states: Dict mapping relay numbers to saved states (0 or 1)
+            - states_mask: Saved states as an 8-bit int, MSB = relay 1, used
+              only until STATE_FILE has been written
             - auto_load: Bool indicating if states should be restored on boot
+
+    Note:
+        Files written by older firmware use long key names and store names
+        and states in other layouts; these are converted on load.
     """
-    config_file = "relay_config.json"
+    global _CONFIG_CACHE, _CONFIG_CRC
+    if _CONFIG_CACHE is not None:
+        return _CONFIG_CACHE
+
     default_config = {
-        "names": {str(i): "" for i in range(1, RELAY_COUNT + 1)},
+        "names": [""] * RELAY_COUNT,
         "settings": {"auto_save": True, "created_time": 0},
-        "states": {str(i): 0 for i in range(1, RELAY_COUNT + 1)},
+        "states_mask": 0,
         "auto_load": True,
     }
 
     try:
-        with open(config_file) as f:
+        with open(CONFIG_FILE) as f:
+            # Parse straight from the stream rather than json.loads(f.read())
+            # to avoid allocating a contiguous buffer for the whole file
             config = json.load(f)
-            # Ensure all required keys exist
-            for key in default_config:
-                if key not in config:
-                    config[key] = default_config[key]
-            return config
+        # Files in the older long-key layout are left uncached by CRC so the
+        # next save rewrites them in the current format
+        legacy = "n" not in config
+        for key, short in _DISK_KEYS:
+            if short in config:
+                config[key] = config.pop(short)
+        _migrate_legacy_config(config)
+        # Ensure all required keys exist
+        for key in default_config:
+            if key not in config:
+                config[key] = default_config[key]
+        if not legacy:
+            _CONFIG_CRC = binascii.crc32(_serialize_config(config).encode())
     except (OSError, ValueError):
         # File doesn't exist or is corrupted
-        save_relay_config(default_config)
-        return default_config
+        config = default_config
+        save_relay_config(config)
+
+    _CONFIG_CACHE = config
+    return config
+
+
+# Relay number strings ("1".."8") keying names/states in legacy config files
+_RELAY_KEYS = tuple(str(i) for i in range(1, RELAY_COUNT + 1))
 
 
-def save_relay_config(config):
+def _migrate_legacy_config(config):
+    """
+    Convert names/states layouts from older firmware in place.
+
+    Older files store names as a dict keyed by relay number strings, and
+    states either the same way or as a list of 0/1 values.
+
+    Args:
+        config (dict): Configuration dictionary as parsed from flash
+    """
+    names = config.get("names")
+    if isinstance(names, dict):
+        config["names"] = [names.get(key, "") for key in _RELAY_KEYS]
+
+    states = config.pop("states", None)
+    if states is not None and "states_mask" not in config:
+        if isinstance(states, dict):
+            states = [states.get(key, 0) for key in _RELAY_KEYS]
+        mask = 0
+        for state in states:
+            mask = (mask << 1) | (1 if state else 0)
+        config["states_mask"] = mask
+
+
+def save_relay_config(config, force=False):
     """
     Save relay configuration to persistent storage.
 
-    Writes the configuration to relay_config.json in the root filesystem.
-    This includes relay names, saved states, and auto-load settings.
+    Writes the configuration to relay_config.json in the root filesystem as
+    compact JSON with short top-level keys. This includes relay names, saved
+    states, and auto-load settings. On success the RAM cache used by
+    load_relay_config() is replaced with this dictionary and any pending
+    deferred changes are considered committed.
+
+    The write is skipped when the serialized configuration has the same CRC32
+    as the copy already in flash, avoiding needless erase/program cycles.
 
     Args:
         config (dict): Configuration dictionary to save, must contain:
             - names: Relay name mappings
             - settings: Configuration settings
-            - states: Saved relay states
+            - states_mask: Saved relay states bitmask
             - auto_load: Auto-load enable flag
+        force (bool): Write even if the content matches what is in flash
 
     Returns:
         bool: True if successful, False if write failed
     """
-    config_file = "relay_config.json"
-    try:
-        with open(config_file, "w") as f:
-            json.dump(config, f)
+    global _CONFIG_CACHE, _CONFIG_DIRTY, _CONFIG_CRC, _NAMES_INT_CACHE
+    payload = _serialize_config(config)
+    crc = binascii.crc32(payload.encode())
+    if force or crc != _CONFIG_CRC:
+        try:
+            with open(CONFIG_FILE, "w") as f:
+                f.write(payload)
+        except OSError:
+            return False
+        _CONFIG_CRC = crc
+
+    if config is not _CONFIG_CACHE:
+        _NAMES_INT_CACHE = None
+    _CONFIG_CACHE = config
+    _CONFIG_DIRTY = False
+    return True
+
+
+def mark_config_dirty():
+    """
+    Flag the cached configuration as modified.
+
+    The change is written to flash by the next commit_relay_config() call,
+    so a burst of updates (e.g. naming all 8 relays) costs a single write.
+    """
+    global _CONFIG_DIRTY
+    _CONFIG_DIRTY = True
+
+
+def _update_config(key, value):
+    """
+    Set a top-level key in the cached configuration and mark it dirty.
+
+    Setters go through here instead of re-validating the whole config; the
+    schema repair in load_relay_config() only runs on the first load.
+
+    Args:
+        key (str): Top-level configuration key
+        value: New value for the key
+    """
+    load_relay_config()[key] = value
+    mark_config_dirty()
+
+
+def commit_relay_config(force=False):
+    """
+    Write pending configuration changes to persistent storage.
+
+    Called periodically from the main loop. SAVE and CLEAR do not go through
+    here: they write relay_state.bin directly.
+
+    Args:
+        force (bool): Write the cached configuration even if it is not dirty
+            or matches the copy already in flash
+
+    Returns:
+        bool: True if nothing needed writing or the write succeeded,
+              False if the write failed
+    """
+    if not (_CONFIG_DIRTY or force):
         return True
-    except OSError:
-        return False
+    return save_relay_config(load_relay_config(), force)
 
 
 def get_relay_name(relay_num):
@@ -273,19 +468,22 @@ def get_relay_name(relay_num):
     Returns:
         str: Relay name or empty string if not set
     """
-    if not is_valid_relay_number(relay_num):
+    try:
+        if not is_valid_relay_number(relay_num):
+            return ""
+        # Return the stored name (which could be empty string)
+        return load_relay_config()["names"][relay_num - 1]
+    except TypeError:
         return ""
 
-    config = load_relay_config()
-    name = config["names"].get(str(relay_num), "")
-    # Return the stored name (which could be empty string)
-    return name
-
 
 def set_relay_name(relay_num, name):
     """
     Set the name of a specific relay
 
+    The change is applied to the cached configuration immediately and
+    written to flash by the next commit_relay_config() call.
+
     Args:
         relay_num (int): Relay number (1-8)
         name (str): New name for the relay
@@ -293,26 +491,80 @@ def set_relay_name(relay_num, name):
     Returns:
         bool: True if successful, False if failed
     """
-    if not is_valid_relay_number(relay_num):
-        return False
-
+    global _NAMES_INT_CACHE
     if not isinstance(name, str) or len(name) > 32:
         return False
 
-    config = load_relay_config()
-    config["names"][str(relay_num)] = name
-    return save_relay_config(config)
+    try:
+        if not is_valid_relay_number(relay_num):
+            return False
+        load_relay_config()["names"][relay_num - 1] = name
+    except TypeError:
+        return False
+    _NAMES_INT_CACHE = None
+    mark_config_dirty()
+    return True
 
 
 def get_all_relay_names():
     """
     Get all relay names
 
+    The dictionary is built once and reused until a relay is renamed, so
+    callers must not modify it.
+
     Returns:
         dict: Dictionary mapping relay numbers to names
     """
-    config = load_relay_config()
-    return {int(k): v for k, v in config["names"].items()}
+    global _NAMES_INT_CACHE
+    if _NAMES_INT_CACHE is None:
+        _NAMES_INT_CACHE = dict(enumerate(load_relay_config()["names"], 1))
+    return _NAMES_INT_CACHE
+
+
+def save_relay_states_fast(mask):
+    """
+    Write a saved states mask to the binary state file.
+
+    The write is skipped when the mask matches what is already stored.
+
+    Args:
+        mask (int): Relay states as an 8-bit int, MSB = relay 1
+
+    Returns:
+        bool: True if successful, False if write failed
+    """
+    global _STATE_MASK
+    if mask == _STATE_MASK:
+        return True
+    try:
+        with open(STATE_FILE, "wb") as f:
+            f.write(bytes((mask,)))
+    except OSError:
+        return False
+    _STATE_MASK = mask
+    return True
+
+
+def load_relay_states_fast():
+    """
+    Read the saved states mask from the binary state file.
+
+    Returns:
+        int or None: Relay states as an 8-bit int (MSB = relay 1), or None if
+                     the file does not exist or is empty
+    """
+    global _STATE_MASK
+    if _STATE_MASK is None:
+        try:
+            with open(STATE_FILE, "rb") as f:
+                data = f.read(1)
+        except OSError:
+            return None
+        if not data:
+            return None
+        _STATE_MASK = data[0]
+    return _STATE_MASK
 
 
 def save_relay_states(states):
@@ -320,7 +572,8 @@ def save_relay_states(states):
     Save current relay states to persistent storage.
 
     Used by the SAVE protocol command to persist the current relay configuration.
-    States are stored in the relay_config.json file along with a timestamp.
+    States are stored in relay_state.bin as a single byte (MSB = relay 1), so
+    saving never rewrites relay_config.json.
 
     Args:
         states (str): 8-character string of relay states where:
@@ -334,21 +587,28 @@ def save_relay_states(states):
     if not isinstance(states, str) or len(states) != 8:
         return False
 
-    if not all(c in "01" for c in states):
+    if states.count("0") + states.count("1") != 8:
         return False
 
-    config = load_relay_config()
-    # Store states with relay numbers as keys
-    for i in range(RELAY_COUNT):
-        config["states"][str(i + 1)] = int(states[i])
+    # Leftmost character (relay 1) becomes the MSB of the mask
+    return save_relay_states_fast(int(states, 2))
 
-    # Update timestamp
-    try:
-        config["settings"]["last_saved"] = time.time()
-    except Exception:
-        pass
 
-    return save_relay_config(config)
+def load_relay_states_mask():
+    """
+    Load saved relay states as a bitmask.
+
+    Reads relay_state.bin, falling back to the mask kept in
+    relay_config.json by older firmware.
+
+    Returns:
+        int or None: Relay states as an 8-bit int (MSB = relay 1), or None if
+                     no saved states exist
+    """
+    mask = load_relay_states_fast()
+    if mask is None:
+        mask = load_relay_config().get("states_mask")
+    return mask
 
 
 def load_relay_states():
@@ -356,25 +616,20 @@ def load_relay_states():
     Load saved relay states from persistent storage.
 
     Used by the LOAD protocol command and auto-load on boot feature.
-    Reads the previously saved states from relay_config.json.
+    Reads the previously saved states from relay_state.bin, falling back to
+    the mask kept in relay_config.json by older firmware.
 
     Returns:
         str or None: 8-character string of relay states in same format as save_relay_states,
                      or None if no saved states exist
     """
-    config = load_relay_config()
-
-    # Check if states exist
-    if "states" not in config:
+    mask = load_relay_states_mask()
+    if mask is None:
         return None
 
     # Convert to string format
     try:
-        states = ""
-        for i in range(1, RELAY_COUNT + 1):
-            state = config["states"].get(str(i), 0)
-            states += "1" if state else "0"
-        return states
+        return f"{mask:08b}"
     except Exception:
         return None
 
@@ -384,21 +639,12 @@ def clear_relay_states():
     Clear saved relay states.
 
     Used by the CLEAR protocol command to remove all saved relay states.
-    Resets all states to 0 (off) and removes the last_saved timestamp.
+    Resets all states to 0 (off).
 
     Returns:
         bool: True if successful, False if write failed
     """
-    config = load_relay_config()
-
-    # Reset all states to 0
-    config["states"] = {str(i): 0 for i in range(1, RELAY_COUNT + 1)}
-
-    # Clear timestamp
-    if "last_saved" in config.get("settings", {}):
-        del config["settings"]["last_saved"]
-
-    return save_relay_config(config)
+    return save_relay_states_fast(0)
 
 
 def get_auto_load_enabled():
@@ -420,14 +666,15 @@ def set_auto_load_enabled(enabled):
     Enable or disable auto-load of saved states on boot.
 
     Controls whether the board automatically restores saved relay states
-    when powered on. This setting is stored persistently.
+    when powered on. This setting is stored persistently by the next
+    commit_relay_config() call.
 
     Args:
         enabled (bool): Whether to enable auto-load
 
     Returns:
-        bool: True if setting was saved successfully, False if write failed
+        bool: Always True; the flag is cached and written to flash by the
+              next commit_relay_config(), which reports any write failure
     """
-    config = load_relay_config()
-    config["auto_load"] = bool(enabled)
-    return save_relay_config(config)
+    _update_config("auto_load", bool(enabled))
+    return True
@@ -13,11 +13,28 @@ import select
 import sys
 import time
 
-from config import FIRMWARE_VERSION, ONBOARD_LED_PIN
+from config import (
+    CONFIG_COMMIT_INTERVAL,
+    ERROR_CODES,
+    FIRMWARE_VERSION,
+    MAX_COMMAND_LENGTH,
+    ONBOARD_LED_PIN,
+    RESPONSE_TERMINATOR,
+    commit_relay_config,
+)
 from machine import WDT, Pin
 from protocol import ProtocolParser
 from relay_controller import RelayController
 
+# Free-heap low-water mark that forces a collection after a command
+_MEM_LOW = 8 * 1024
+
+# Byte values that end a command line
+_TERMS = b"\r\n"
+
+# Reply to a line longer than MAX_COMMAND_LENGTH
+_RESP_TOO_LONG = ERROR_CODES["INVALID_PARAMETER"] + RESPONSE_TERMINATOR
+
 
 def main():
     """
@@ -27,16 +44,20 @@ def main():
     - 8-second watchdog timer to prevent hangs
     - 2Hz heartbeat LED on GP25 for health monitoring
     - Non-blocking serial I/O with select.poll()
-    - Periodic garbage collection every 10 commands
+    - Garbage collection when free heap drops below 8KB, plus an
+      allocation threshold so MicroPython collects proactively
+    - Deferred configuration writes flushed to flash every 2 seconds
     - Automatic relay state restoration if enabled
     - Boot beep to indicate ready status
 
     The main loop:
     1. Feeds the watchdog every 100ms
     2. Updates heartbeat LED every 500ms
-    3. Polls for serial input with 100ms timeout
-    4. Processes complete commands when newline received
-    5. Handles errors gracefully without crashing
+    3. Commits pending configuration changes every CONFIG_COMMIT_INTERVAL
+    4. Polls for serial input until the next heartbeat is due (max 100ms)
+    5. Drains waiting input bytes into a fixed buffer and processes the
+       first complete command (newline received)
+    6. Handles errors gracefully without crashing
     """
     # Minimal startup message to reduce memory usage
     print(f"PICO RELAY B v{FIRMWARE_VERSION} Ready")
@@ -49,6 +70,7 @@ def main():
         led = Pin(ONBOARD_LED_PIN, Pin.OUT)
         led_state = False
         last_heartbeat = time.ticks_ms()
+        last_commit = last_heartbeat
 
         # Initialize components
         # Initialize components without print statements
@@ -64,45 +86,103 @@ def main():
         #           SET <pattern>, PULSE <relay> <ms>, BEEP, BUZZ ON/OFF
 
         # Simple USB serial command loop with error handling
-        buffer = ""
+        # Fixed-size receive buffer; a line longer than MAX_COMMAND_LENGTH
+        # is discarded whole and answered with an error
+        buffer = bytearray(MAX_COMMAND_LENGTH)
+        length = 0
+        overflow = False
         poll = select.poll()
         poll.register(sys.stdin, select.POLLIN)
 
+        # Bind hot-loop callables to locals so each call is a local load
+        # instead of a global plus attribute lookup
+        feed = wdt.feed
+        led_value = led.value
+        ticks_ms = time.ticks_ms
+        ticks_diff = time.ticks_diff
+        sleep_ms = time.sleep_ms
+        poll_wait = poll.poll
+        read = sys.stdin.buffer.read
+        write = sys.stdout.write
+        # Not every port exposes stdout.flush(); without it, pace only long
+        # responses so the USB CDC buffer is not overrun
+        flush = getattr(sys.stdout, "flush", None)
+        process_command = protocol.process_command
+        collect = gc.collect
+        terms = _TERMS
+        mem_free = gc.mem_free
+
+        # Let the allocator collect on its own once a quarter of the
+        # remaining heap has been used
+        gc.threshold(mem_free() // 4 + gc.mem_alloc())
+
         while True:
             try:
                 # Feed watchdog
-                wdt.feed()
+                feed()
 
                 # Update heartbeat LED every 500ms (2Hz for active indication)
-                current_time = time.ticks_ms()
-                if time.ticks_diff(current_time, last_heartbeat) >= 500:
+                current_time = ticks_ms()
+                if ticks_diff(current_time, last_heartbeat) >= 500:
                     led_state = not led_state
-                    led.value(led_state)
+                    led_value(led_state)
                     last_heartbeat = current_time
 
-                # Check for available data (non-blocking)
-                events = poll.poll(100)  # 100ms timeout
-
-                if events:
-                    # Read available data
-                    char = sys.stdin.read(1)
-                    if char:
-                        if char == "\n" or char == "\r":
-                            # Process complete line
-                            if buffer:
-                                try:
-                                    response = protocol.process_command(buffer)
-                                    print(response, end="")
-                                    # Add small delay to prevent buffer overflow
-                                    time.sleep_ms(10)
-                                    # Trigger garbage collection periodically
-                                    if protocol.command_count % 10 == 0:
-                                        gc.collect()
-                                except Exception as e:
-                                    print(f"ERROR:PROCESSING:{e}\n")
-                                buffer = ""
-                        else:
-                            buffer += char
+                # Flush deferred configuration changes (names, auto-load)
+                if ticks_diff(current_time, last_commit) >= CONFIG_COMMIT_INTERVAL:
+                    commit_relay_config()
+                    last_commit = current_time
+
+                # Wait for data, waking no later than the next heartbeat
+                # toggle and at most 100ms so the watchdog is fed regularly
+                timeout = 500 - ticks_diff(current_time, last_heartbeat)
+                if timeout > 100:
+                    timeout = 100
+                elif timeout < 1:
+                    timeout = 1
+                events = poll_wait(timeout)
+
+                # Drain every byte already waiting rather than one byte per
+                # wakeup. Stdin reads block until the requested count arrives,
+                # so bytes are read singly while poll reports more data.
+                while events:
+                    data = read(1)
+                    if not data:
+                        break
+                    byte = data[0]
+                    if byte in terms:
+                        if overflow:
+                            # Never execute a truncated prefix
+                            write(_RESP_TOO_LONG)
+                            overflow = False
+                            length = 0
+                            break
+                        # Process complete line
+                        if length:
+                            try:
+                                response = process_command(
+                                    str(buffer[:length], "utf-8")
+                                )
+                                write(response)
+                                if flush:
+                                    flush()
+                                elif len(response) > 32:
+                                    sleep_ms(10)
+                                # Collect only when the heap is running low
+                                if mem_free() < _MEM_LOW:
+                                    collect()
+                            except Exception as e:
+                                print(f"ERROR:PROCESSING:{e}\n")
+                            length = 0
+                            # Return to the outer loop so the watchdog is fed
+                            # between commands
+                            break
+                    elif length < MAX_COMMAND_LENGTH:
+                        buffer[length] = byte
+                        length += 1
+                    else:
+                        overflow = True
+                    events = poll_wait(0)
 
             except KeyboardInterrupt:
                 print("\nShutdown requested")
@@ -117,6 +197,8 @@ def main():
         sys.print_exception(e)
 
 
-# Auto-start when the module is loaded by MicroPython
-# This ensures the server starts automatically on boot
-main()
+# MicroPython runs main.py as __main__ after boot.py, so the server still
+# starts automatically on boot, while importing this module (e.g. from the
+# REPL) has no side effects
+if __name__ == "__main__":
+    main()
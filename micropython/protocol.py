@@ -14,13 +14,12 @@ import time
 from config import (
     BOARD_NAME,
     BOARD_VERSION,
-    DEBUG,
-    DEBUG_COMMANDS,
     ERROR_CODES,
     FIRMWARE_VERSION,
     PING_RESPONSE,
     PROTOCOL_VERSION,
     RELAY_COUNT,
+    RELAY_OFF,
     RESPONSE_TERMINATOR,
     SUCCESS_RESPONSE,
     clear_relay_states,
@@ -28,11 +27,245 @@ from config import (
     get_board_uid,
     get_relay_name,
     is_valid_relay_number,
-    load_relay_states,
-    save_relay_states,
+    load_relay_states_mask,
+    save_relay_states_fast,
     set_relay_name,
 )
 
+import micropython
+from micropython import const
+
+# Compile-time debug switches (mirror config.DEBUG/DEBUG_COMMANDS). As
+# module-local const()s the `if _DEBUG:` checks are removed from the bytecode
+# entirely when False.
+_DEBUG = const(False)
+_DEBUG_COMMANDS = const(False)
+
+
+def _terminated(response):
+    """Return response with RESPONSE_TERMINATOR appended if missing."""
+    if response.endswith(RESPONSE_TERMINATOR):
+        return response
+    return response + RESPONSE_TERMINATOR
+
+
+_HELP_TEXT = (
+    "Commands: PING,STATUS,ON,OFF,ALL,SET,PULSE,INFO,UID,NAME,GET,BEEP,BUZZ,"
+    "TONE,VERSION,HELP,SAVE,LOAD,CLEAR"
+)
+
+# Fixed responses, terminated once at import so handlers return them as-is
+_TERMINATED_ERRORS = {code: _terminated(text) for code, text in ERROR_CODES.items()}
+_RESP_INVALID_COMMAND = _TERMINATED_ERRORS["INVALID_COMMAND"]
+_RESP_INVALID_PARAMETER = _TERMINATED_ERRORS["INVALID_PARAMETER"]
+_RESP_HARDWARE_ERROR = _TERMINATED_ERRORS["HARDWARE_ERROR"]
+_RESP_OK = _terminated(SUCCESS_RESPONSE)
+_RESP_PONG = _terminated(PING_RESPONSE)
+_RESP_SAVED = _terminated("SAVED")
+_RESP_LOADED = _terminated("LOADED")
+_RESP_CLEARED = _terminated("CLEARED")
+_RESP_HELP = _terminated(_HELP_TEXT)
+_RESP_VERSION = _terminated(FIRMWARE_VERSION)
+# Board info and UID are computed once at import by config
+_RESP_INFO = _terminated(get_board_info())
+_RESP_UID = _terminated(get_board_uid())
+
+# Commands whose first parameter is a keyword (ON/OFF, NAME), uppercased once
+# by parse_command
+_KEYWORD_COMMANDS = ("ALL", "BUZZ", "GET")
+
+# Expected parameter count for each command. -1 marks a variable count,
+# with the allowed counts listed in _VARIADIC_PARAMS.
+_EXPECTED_PARAMS = {
+    "ON": 1,
+    "OFF": 1,
+    "STATUS": 0,
+    "PING": 0,
+    "ALL": 1,  # ALL ON or ALL OFF
+    "SET": 1,  # SET <8-bit binary>
+    "PULSE": 2,  # PULSE <relay_number> <duration_ms>
+    "INFO": 0,  # INFO - board information
+    "UID": 0,  # UID - unique identifier
+    "NAME": -1,  # NAME <relay_number> [<name>]
+    "GET": 2,  # GET NAME <relay_number>
+    "BEEP": -1,  # BEEP or BEEP <duration_ms>
+    "BUZZ": 1,  # BUZZ ON or BUZZ OFF
+    "TONE": 2,  # TONE <frequency_hz> <duration_ms>
+    "VERSION": 0,  # VERSION - firmware version
+    "HELP": 0,  # HELP - list available commands
+    "SAVE": 0,  # SAVE - save current relay states
+    "LOAD": 0,  # LOAD - load saved relay states
+    "CLEAR": 0,  # CLEAR - clear saved relay states
+}
+_VARIADIC_PARAMS = {
+    "NAME": (1, 2),
+    "BEEP": (0, 1),
+}
+
+
+def _validate_relay(parameters):
+    """Validate ON/OFF: <relay_number>."""
+    try:
+        relay_num = int(parameters[0])
+    except ValueError:
+        return "INVALID_RELAY_NUMBER", None
+    if not is_valid_relay_number(relay_num):
+        return "INVALID_RELAY_NUMBER", None
+    return None, (relay_num,)
+
+
+def _validate_on_off(parameters):
+    """Validate ALL/BUZZ: ON or OFF."""
+    if parameters[0] not in ("ON", "OFF"):
+        return "INVALID_PARAMETER", None
+    return None, None
+
+
+def _validate_set(parameters):
+    """Validate SET: <8-bit binary pattern>."""
+    pattern = parameters[0]
+    # str.count runs in C; int(pattern, 2) alone would also accept a sign
+    # or underscores
+    if len(pattern) != 8 or pattern.count("0") + pattern.count("1") != 8:
+        return "INVALID_PARAMETER", None
+    return None, (int(pattern, 2),)
+
+
+def _validate_pulse(parameters):
+    """Validate PULSE: <relay_number> <duration_ms>."""
+    try:
+        relay_num = int(parameters[0])
+        if not is_valid_relay_number(relay_num):
+            return "INVALID_RELAY_NUMBER", None
+        duration_ms = int(parameters[1])
+    except ValueError:
+        return "INVALID_PARAMETER", None
+    if duration_ms <= 0 or duration_ms > 5000:  # Max 5 seconds (watchdog safe)
+        return "INVALID_PARAMETER", None
+    return None, (relay_num, duration_ms)
+
+
+def _validate_name(parameters):
+    """Validate NAME: <relay_number> [<name>]."""
+    try:
+        relay_num = int(parameters[0])
+    except ValueError:
+        return "INVALID_RELAY_NUMBER", None
+    if not is_valid_relay_number(relay_num):
+        return "INVALID_RELAY_NUMBER", None
+    # If name is provided, validate it
+    if len(parameters) == 2 and len(parameters[1]) > 32:
+        return "INVALID_PARAMETER", None
+    return None, (relay_num,)
+
+
+def _validate_get(parameters):
+    """Validate GET: NAME <relay_number>."""
+    if parameters[0] != "NAME":
+        return "INVALID_PARAMETER", None
+    try:
+        relay_num = int(parameters[1])
+    except ValueError:
+        return "INVALID_RELAY_NUMBER", None
+    if not is_valid_relay_number(relay_num):
+        return "INVALID_RELAY_NUMBER", None
+    return None, (relay_num,)
+
+
+def _validate_beep(parameters):
+    """Validate BEEP: [<duration_ms>]."""
+    if not parameters:
+        return None, (100,)  # Default beep duration
+    try:
+        duration_ms = int(parameters[0])
+    except ValueError:
+        return "INVALID_PARAMETER", None
+    if duration_ms <= 0 or duration_ms > 5000:  # Max 5 seconds
+        return "INVALID_PARAMETER", None
+    return None, (duration_ms,)
+
+
+def _validate_tone(parameters):
+    """Validate TONE: <frequency_hz> <duration_ms>."""
+    try:
+        frequency = int(parameters[0])
+        duration_ms = int(parameters[1])
+    except ValueError:
+        return "INVALID_PARAMETER", None
+    if frequency < 50 or frequency > 20000:  # Human hearing range
+        return "INVALID_PARAMETER", None
+    if duration_ms <= 0 or duration_ms > 5000:  # Max 5 seconds (watchdog safe)
+        return "INVALID_PARAMETER", None
+    return None, (frequency, duration_ms)
+
+
+# Parameter value validators, keyed by command. Each returns
+# (error_code, parsed) where parsed holds the numeric parameters already
+# converted with int(), so handlers do not parse them again. Commands without
+# an entry only need the parameter count check.
+_VALIDATORS = {
+    "ON": _validate_relay,
+    "OFF": _validate_relay,
+    "ALL": _validate_on_off,
+    "SET": _validate_set,
+    "PULSE": _validate_pulse,
+    "NAME": _validate_name,
+    "GET": _validate_get,
+    "BEEP": _validate_beep,
+    "BUZZ": _validate_on_off,
+    "TONE": _validate_tone,
+}
+
+
+class _NullController:
+    """
+    Stand-in controller used when the parser has no hardware.
+
+    Every operation reports failure, so handlers call the controller
+    unconditionally and still answer HARDWARE_ERROR without a per-command
+    None check. Status reads report all relays off.
+    """
+
+    def relay_on(self, relay_num):
+        return False
+
+    def relay_off(self, relay_num):
+        return False
+
+    def all_on(self):
+        return False
+
+    def all_off(self):
+        return False
+
+    def set_mask(self, mask):
+        return False
+
+    def set_states(self, states):
+        return False
+
+    def pulse_relay(self, relay_num, duration_ms, end_state=None):
+        return False
+
+    def get_status_binary(self):
+        return "00000000"
+
+    def get_states_mask(self):
+        # No state to save; SAVE reports HARDWARE_ERROR
+        return None
+
+    def buzzer_beep(self, duration_ms=100):
+        return False
+
+    def buzzer_on(self):
+        return False
+
+    def buzzer_off(self):
+        return False
+
+    def buzzer_tone(self, frequency, duration_ms):
+        return False
+
 
 class ProtocolParser:
     """
@@ -50,7 +283,8 @@ class ProtocolParser:
         - OFF <relay>           Turn off relay (1-8)
         - ALL ON/OFF            Turn all relays on or off
         - SET <pattern>         Set relay pattern (8-bit binary, MSB=relay8)
-        - PULSE <relay> <ms>    Pulse relay for duration (max 5000ms)
+        - PULSE <relay> <ms>    Pulse relay for duration (max 5000ms),
+                                returns immediately
 
         Query Commands:
         - STATUS                Get all relay states (8-bit binary)
@@ -72,6 +306,9 @@ class ProtocolParser:
         - BUZZ ON/OFF           Continuous buzzer on/off
         - TONE <hz> <ms>        Play tone (50-20000Hz, max 5000ms)
 
+    The per-command hot path (parse, validate, format, process) is compiled
+    with the native code emitter.
+
     Attributes:
         relay_controller: RelayController instance for hardware control
         command_count: Total commands processed
@@ -85,22 +322,56 @@ class ProtocolParser:
 
         Args:
             relay_controller: RelayController instance for hardware control.
-                            If None, only validation is performed.
+                            If None, only validation is performed and
+                            hardware commands answer HARDWARE_ERROR.
         """
-        self.relay_controller = relay_controller
+        self.relay_controller = relay_controller or _NullController()
         self.command_count = 0
         self.error_count = 0
         self.last_command_time = 0
+        # Reused by get_statistics() instead of building a new dict per call
+        self._stats = {
+            "command_count": 0,
+            "error_count": 0,
+            "error_rate": 0.0,
+            "last_command_time": 0,
+        }
+
+        # Command name -> bound handler, built once so dispatch is one lookup
+        self._dispatch = {
+            "PING": self._cmd_ping,
+            "STATUS": self._cmd_status,
+            "ON": self._cmd_on,
+            "OFF": self._cmd_off,
+            "ALL": self._cmd_all,
+            "SET": self._cmd_set,
+            "PULSE": self._cmd_pulse,
+            "INFO": self._cmd_info,
+            "UID": self._cmd_uid,
+            "VERSION": self._cmd_version,
+            "HELP": self._cmd_help,
+            "NAME": self._cmd_name,
+            "GET": self._cmd_get,
+            "BEEP": self._cmd_beep,
+            "BUZZ": self._cmd_buzz,
+            "TONE": self._cmd_tone,
+            "SAVE": self._cmd_save,
+            "LOAD": self._cmd_load,
+            "CLEAR": self._cmd_clear,
+        }
 
-        if DEBUG:
+        if _DEBUG:
             print("ProtocolParser initialized")
 
+    @micropython.native
     def parse_command(self, command_str):
         """
         Parse a command string into command and parameters.
 
-        Strips whitespace, converts to uppercase, and splits into command
-        and parameter components.
+        Splits on whitespace in a single pass and uppercases only the command
+        token. Parameters keep their case so NAME stores names as sent,
+        except the keyword sub-command of ALL/BUZZ (ON/OFF) and GET (NAME),
+        which is uppercased here once for validation and execution.
 
         Args:
             command_str (str): Raw command string from serial input
@@ -110,22 +381,23 @@ class ProtocolParser:
                 - command is uppercase string or None if empty
                 - parameters_list is list of parameter strings
         """
-        # Remove leading/trailing whitespace and convert to uppercase
-        command_str = command_str.strip().upper()
+        # split() also drops leading/trailing whitespace
+        parts = command_str.split()
 
-        if not command_str:
+        if not parts:
             return None, None
 
-        # Split into command and parameters
-        parts = command_str.split()
-        command = parts[0] if parts else None
-        parameters = parts[1:] if len(parts) > 1 else []
+        command = parts[0].upper()
+        parameters = parts[1:]
+        if parameters and command in _KEYWORD_COMMANDS:
+            parameters[0] = parameters[0].upper()
 
-        if DEBUG_COMMANDS:
+        if _DEBUG_COMMANDS:
             print(f"Parsed command: '{command}', parameters: {parameters}")
 
         return command, parameters
 
+    @micropython.native
     def validate_command(self, command, parameters):
         """
         Validate command and parameters.
@@ -135,141 +407,43 @@ class ProtocolParser:
 
         Args:
             command (str): Uppercase command name
-            parameters (list): List of parameter strings
+            parameters (list): List of parameter strings as returned by
+                parse_command (keyword sub-commands already uppercased)
 
         Returns:
-            tuple: (is_valid, error_code) where:
+            tuple: (is_valid, error_code, parsed) where:
                 - is_valid is True if command is valid
                 - error_code is string error code if invalid, None if valid
+                - parsed is a tuple of the numeric parameters converted to
+                  int (e.g. (relay_num, duration_ms) for PULSE), or None
         """
         if not command:
-            return False, "EMPTY_COMMAND"
-
-        # Define expected parameter counts for each command
-        expected_params = {
-            "ON": 1,
-            "OFF": 1,
-            "STATUS": 0,
-            "PING": 0,
-            "ALL": 1,  # ALL ON or ALL OFF
-            "SET": 1,  # SET <8-bit binary>
-            "PULSE": 2,  # PULSE <relay_number> <duration_ms>
-            "INFO": 0,  # INFO - board information
-            "UID": 0,  # UID - unique identifier
-            "NAME": [1, 2],  # NAME <relay_number> [<name>]
-            "GET": 2,  # GET NAME <relay_number>
-            "BEEP": [0, 1],  # BEEP or BEEP <duration_ms>
-            "BUZZ": 1,  # BUZZ ON or BUZZ OFF
-            "TONE": 2,  # TONE <frequency_hz> <duration_ms>
-            "VERSION": 0,  # VERSION - firmware version
-            "HELP": 0,  # HELP - list available commands
-            "SAVE": 0,  # SAVE - save current relay states
-            "LOAD": 0,  # LOAD - load saved relay states
-            "CLEAR": 0,  # CLEAR - clear saved relay states
-        }
+            return False, "EMPTY_COMMAND", None
 
         # Check if command is supported
-        if command not in expected_params:
-            return False, "INVALID_COMMAND"
+        expected_count = _EXPECTED_PARAMS.get(command)
+        if expected_count is None:
+            return False, "INVALID_COMMAND", None
 
         # Check parameter count
-        expected_count = expected_params[command]
-        if isinstance(expected_count, list):
+        if expected_count < 0:
             # Variable parameter count (e.g., BEEP)
-            if len(parameters) not in expected_count:
-                return False, "INVALID_PARAMETER_COUNT"
-        else:
-            # Fixed parameter count
-            if len(parameters) != expected_count:
-                return False, "INVALID_PARAMETER_COUNT"
-
-        # Validate parameters for relay commands
-        if command in ["ON", "OFF"]:
-            try:
-                relay_num = int(parameters[0])
-                if not is_valid_relay_number(relay_num):
-                    return False, "INVALID_RELAY_NUMBER"
-            except ValueError:
-                return False, "INVALID_RELAY_NUMBER"
-
-        # Validate parameters for ALL commands
-        if command == "ALL" and parameters[0].upper() not in ["ON", "OFF"]:
-            return False, "INVALID_PARAMETER"
-
-        # Validate parameters for SET command
-        if command == "SET":
-            pattern = parameters[0]
-            if len(pattern) != 8 or not all(c in "01" for c in pattern):
-                return False, "INVALID_PARAMETER"
-
-        # Validate parameters for PULSE command
-        if command == "PULSE":
-            try:
-                relay_num = int(parameters[0])
-                if not is_valid_relay_number(relay_num):
-                    return False, "INVALID_RELAY_NUMBER"
-                duration_ms = int(parameters[1])
-                if (
-                    duration_ms <= 0 or duration_ms > 5000
-                ):  # Max 5 seconds (watchdog safe)
-                    return False, "INVALID_PARAMETER"
-            except ValueError:
-                return False, "INVALID_PARAMETER"
-
-        # Validate parameters for NAME command
-        if command == "NAME":
-            try:
-                relay_num = int(parameters[0])
-                if not is_valid_relay_number(relay_num):
-                    return False, "INVALID_RELAY_NUMBER"
-                # If name is provided, validate it
-                if len(parameters) == 2:
-                    name = parameters[1]
-                    if not isinstance(name, str) or len(name) > 32:
-                        return False, "INVALID_PARAMETER"
-            except ValueError:
-                return False, "INVALID_RELAY_NUMBER"
-
-        # Validate parameters for GET NAME command
-        if command == "GET":
-            if parameters[0].upper() != "NAME":
-                return False, "INVALID_PARAMETER"
-            try:
-                relay_num = int(parameters[1])
-                if not is_valid_relay_number(relay_num):
-                    return False, "INVALID_RELAY_NUMBER"
-            except ValueError:
-                return False, "INVALID_RELAY_NUMBER"
-
-        # Validate parameters for BEEP command
-        if command == "BEEP" and len(parameters) == 1:
-            try:
-                duration_ms = int(parameters[0])
-                if duration_ms <= 0 or duration_ms > 5000:  # Max 5 seconds
-                    return False, "INVALID_PARAMETER"
-            except ValueError:
-                return False, "INVALID_PARAMETER"
-
-        # Validate parameters for BUZZ command
-        if command == "BUZZ" and parameters[0].upper() not in ["ON", "OFF"]:
-            return False, "INVALID_PARAMETER"
-
-        # Validate parameters for TONE command
-        if command == "TONE":
-            try:
-                frequency = int(parameters[0])
-                duration_ms = int(parameters[1])
-                if frequency < 50 or frequency > 20000:  # Human hearing range
-                    return False, "INVALID_PARAMETER"
-                if (
-                    duration_ms <= 0 or duration_ms > 5000
-                ):  # Max 5 seconds (watchdog safe)
-                    return False, "INVALID_PARAMETER"
-            except ValueError:
-                return False, "INVALID_PARAMETER"
-
-        return True, None
-
+            if len(parameters) not in _VARIADIC_PARAMS[command]:
+                return False, "INVALID_PARAMETER_COUNT", None
+        elif len(parameters) != expected_count:
+            return False, "INVALID_PARAMETER_COUNT", None
+
+        # Validate parameter values for commands that take them
+        validator = _VALIDATORS.get(command)
+        if validator:
+            error_code, parsed = validator(parameters)
+            if error_code:
+                return False, error_code, None
+            return True, None, parsed
+
+        return True, None, None
+
+    @micropython.native
     def format_response(self, success, data=None, error=None):
         """
         Format response according to protocol.
@@ -285,14 +459,13 @@ class ProtocolParser:
         Returns:
             str: Formatted response with terminator
         """
-        if success:
-            response = str(data) if data is not None else SUCCESS_RESPONSE
-        else:
-            if error in ERROR_CODES:
-                response = ERROR_CODES[error]
-            else:
-                response = ERROR_CODES["INVALID_COMMAND"]
+        # Fixed responses come pre-terminated from module-level tables
+        if not success:
+            return _TERMINATED_ERRORS.get(error, _RESP_INVALID_COMMAND)
+        if data is None:
+            return _RESP_OK
 
+        response = str(data)
         # Ensure response ends with terminator
         if not response.endswith(RESPONSE_TERMINATOR):
             response += RESPONSE_TERMINATOR
@@ -337,11 +510,10 @@ class ProtocolParser:
             str: 8-bit binary string where MSB = relay 8, LSB = relay 1.
                  Returns "00000000" if no controller available.
         """
-        if not self.relay_controller:
-            return "00000000"
-
+        # The controller caches the string between relay changes
         return self.relay_controller.get_status_binary()
 
+    @micropython.native
     def process_command(self, command_str):
         """
         Process a complete command string.
@@ -359,9 +531,17 @@ class ProtocolParser:
         self.command_count += 1
         self.last_command_time = time.ticks_ms()
 
-        if DEBUG_COMMANDS:
+        if _DEBUG_COMMANDS:
             print(f"Processing command #{self.command_count}: '{command_str.strip()}'")
 
+        # Fast path for the commands hosts poll most often, sent exactly as
+        # the host library encodes them. Any other spelling (lowercase,
+        # padding) takes the full path below and gets the same response.
+        if command_str == "STATUS":
+            return self.get_relay_status_string() + RESPONSE_TERMINATOR
+        if command_str == "PING":
+            return _RESP_PONG
+
         # Parse command
         command, parameters = self.parse_command(command_str)
 
@@ -370,36 +550,39 @@ class ProtocolParser:
             return self.format_error_response("INVALID_COMMAND")
 
         # Validate command
-        is_valid, error_message = self.validate_command(command, parameters)
+        is_valid, error_message, parsed = self.validate_command(command, parameters)
         if not is_valid:
             self.error_count += 1
             return self.format_error_response(error_message)
 
         # Execute command
         try:
-            response = self.execute_command(command, parameters)
+            response = self.execute_command(command, parameters, parsed)
 
-            if DEBUG_COMMANDS:
+            if _DEBUG_COMMANDS:
                 print(f"Command executed successfully, response: '{response.strip()}'")
 
             return response
 
         except Exception as e:
             self.error_count += 1
-            if DEBUG:
+            if _DEBUG:
                 print(f"Command execution error: {e}")
             return self.format_error_response("HARDWARE_ERROR")
 
-    def execute_command(self, command, parameters):
+    def execute_command(self, command, parameters, parsed=None):
         """
         Execute a validated command.
 
-        Dispatches commands to appropriate handlers and formats responses.
-        All commands are guaranteed to be valid when this method is called.
+        Looks up the command's _cmd_* handler in the dispatch table built by
+        __init__. All commands are guaranteed to be valid when this method is
+        called.
 
         Args:
             command (str): Validated uppercase command name
             parameters (list): Validated parameter list
+            parsed (tuple, optional): Numeric parameters as returned by
+                validate_command
 
         Returns:
             str: Formatted response string with terminator
@@ -407,205 +590,169 @@ class ProtocolParser:
         Note:
             This method assumes validation has already been performed
         """
-        if command == "PING":
-            return self.format_success_response(
-                PING_RESPONSE.replace(RESPONSE_TERMINATOR, "")
-            )
-
-        elif command == "STATUS":
-            status = self.get_relay_status_string()
-            return self.format_success_response(status)
-
-        elif command == "ON":
-            relay_num = int(parameters[0])
-            if self.relay_controller:
-                if self.relay_controller.relay_on(relay_num):
-                    return self.format_success_response()
-                else:
-                    return self.format_error_response("HARDWARE_ERROR")
-            else:
-                return self.format_error_response("HARDWARE_ERROR")
-
-        elif command == "OFF":
-            relay_num = int(parameters[0])
-            if self.relay_controller:
-                if self.relay_controller.relay_off(relay_num):
-                    return self.format_success_response()
-                else:
-                    return self.format_error_response("HARDWARE_ERROR")
-            else:
-                return self.format_error_response("HARDWARE_ERROR")
-
-        elif command == "ALL":
-            operation = parameters[0].upper()
-            if self.relay_controller:
-                if operation == "ON":
-                    if self.relay_controller.all_on():
-                        return self.format_success_response()
-                    else:
-                        return self.format_error_response("HARDWARE_ERROR")
-                elif operation == "OFF":
-                    if self.relay_controller.all_off():
-                        return self.format_success_response()
-                    else:
-                        return self.format_error_response("HARDWARE_ERROR")
-                else:
-                    return self.format_error_response("INVALID_PARAMETER")
-            else:
-                return self.format_error_response("HARDWARE_ERROR")
-
-        elif command == "SET":
-            pattern = parameters[0]
-            if self.relay_controller:
-                if self.relay_controller.set_pattern(pattern):
-                    return self.format_success_response()
-                else:
-                    return self.format_error_response("HARDWARE_ERROR")
-            else:
-                return self.format_error_response("HARDWARE_ERROR")
-
-        elif command == "PULSE":
-            relay_num = int(parameters[0])
-            duration_ms = int(parameters[1])
-            if self.relay_controller:
-                # Turn relay on
-                if self.relay_controller.relay_on(relay_num):
-                    # Schedule turning it off after duration
-                    import time
-
-                    time.sleep_ms(duration_ms)
-                    self.relay_controller.relay_off(relay_num)
-                    return self.format_success_response()
-                else:
-                    return self.format_error_response("HARDWARE_ERROR")
-            else:
-                return self.format_error_response("HARDWARE_ERROR")
-
-        elif command == "INFO":
-            # Return board information including UID
-            info = get_board_info()
-            return self.format_success_response(info)
-
-        elif command == "UID":
-            # Return only the unique identifier
-            uid = get_board_uid()
-            return self.format_success_response(uid)
-
-        elif command == "VERSION":
-            # Return firmware version
-            return self.format_success_response(FIRMWARE_VERSION)
-
-        elif command == "HELP":
-            # Return list of available commands
-            help_text = "Commands: PING,STATUS,ON,OFF,ALL,SET,PULSE,INFO,UID,NAME,GET,BEEP,BUZZ,TONE,VERSION,HELP,SAVE,LOAD,CLEAR"
-            return self.format_success_response(help_text)
-
-        elif command == "NAME":
-            # Set or reset relay name: NAME <relay_number> [<name>]
-            relay_num = int(parameters[0])
-            if len(parameters) == 1:
-                # Clear the name (empty string)
-                name = ""
-            else:
-                # Set custom name
-                name = parameters[1]
-            if set_relay_name(relay_num, name):
-                return self.format_success_response()
-            else:
-                return self.format_error_response("HARDWARE_ERROR")
-
-        elif command == "GET":
-            # Get relay name: GET NAME <relay_number>
-            if parameters[0].upper() == "NAME":
-                relay_num = int(parameters[1])
-                name = get_relay_name(relay_num)
-                return self.format_success_response(name)
-            else:
-                return self.format_error_response("INVALID_PARAMETER")
-
-        elif command == "BEEP":
-            # Beep: BEEP or BEEP <duration_ms>
-            if self.relay_controller:
-                duration_ms = 100  # Default beep duration
-                if len(parameters) == 1:
-                    duration_ms = int(parameters[0])
-
-                if self.relay_controller.buzzer_beep(duration_ms):
-                    return self.format_success_response()
-                else:
-                    return self.format_error_response("HARDWARE_ERROR")
-            else:
-                return self.format_error_response("HARDWARE_ERROR")
-
-        elif command == "BUZZ":
-            # Buzz: BUZZ ON or BUZZ OFF
-            if self.relay_controller:
-                operation = parameters[0].upper()
-                if operation == "ON":
-                    if self.relay_controller.buzzer_on():
-                        return self.format_success_response()
-                    else:
-                        return self.format_error_response("HARDWARE_ERROR")
-                elif operation == "OFF":
-                    if self.relay_controller.buzzer_off():
-                        return self.format_success_response()
-                    else:
-                        return self.format_error_response("HARDWARE_ERROR")
+        handler = self._dispatch.get(command)
+        if handler is None:
+            return self.format_error_response("INVALID_COMMAND")
+        return handler(parameters, parsed)
+
+    def _cmd_ping(self, parameters, parsed):
+        """PING: connection test."""
+        return _RESP_PONG
+
+    def _cmd_status(self, parameters, parsed):
+        """STATUS: all relay states as an 8-bit binary string."""
+        return self.get_relay_status_string() + RESPONSE_TERMINATOR
+
+    def _cmd_on(self, parameters, parsed):
+        """ON <relay>: turn a relay on."""
+        relay_num = parsed[0]
+        if self.relay_controller.relay_on(relay_num):
+            return _RESP_OK
+        else:
+            return _RESP_HARDWARE_ERROR
+
+    def _cmd_off(self, parameters, parsed):
+        """OFF <relay>: turn a relay off."""
+        relay_num = parsed[0]
+        if self.relay_controller.relay_off(relay_num):
+            return _RESP_OK
+        else:
+            return _RESP_HARDWARE_ERROR
+
+    def _cmd_all(self, parameters, parsed):
+        """ALL ON/OFF: switch every relay."""
+        operation = parameters[0]
+        if operation == "ON":
+            if self.relay_controller.all_on():
+                return _RESP_OK
             else:
-                return self.format_error_response("HARDWARE_ERROR")
-
-        elif command == "TONE":
-            # Tone: TONE <frequency_hz> <duration_ms>
-            if self.relay_controller:
-                frequency = int(parameters[0])
-                duration_ms = int(parameters[1])
-
-                if self.relay_controller.buzzer_tone(frequency, duration_ms):
-                    return self.format_success_response()
-                else:
-                    return self.format_error_response("HARDWARE_ERROR")
+                return _RESP_HARDWARE_ERROR
+        elif operation == "OFF":
+            if self.relay_controller.all_off():
+                return _RESP_OK
             else:
-                return self.format_error_response("HARDWARE_ERROR")
-
-        elif command == "SAVE":
-            # Save current relay states to persistent storage
-            # Get states in binary format (MSB = relay 8)
-            binary_states = self.relay_controller.get_status_binary()
-            # Reverse to storage format (relay 1 first) for consistency
-            # MicroPython doesn't support [::-1], so reverse manually
-            storage_states = "".join(reversed(binary_states))
-            if save_relay_states(storage_states):
-                return self.format_success_response("SAVED")
+                return _RESP_HARDWARE_ERROR
+        else:
+            return _RESP_INVALID_PARAMETER
+
+    def _cmd_set(self, parameters, parsed):
+        """SET <pattern>: apply an 8-bit relay pattern."""
+        if self.relay_controller.set_mask(parsed[0]):
+            return _RESP_OK
+        else:
+            return _RESP_HARDWARE_ERROR
+
+    def _cmd_pulse(self, parameters, parsed):
+        """PULSE <relay> <ms>: turn a relay on for a duration."""
+        relay_num, duration_ms = parsed
+        # The controller ends the pulse from a one-shot timer, so the command
+        # loop keeps serving commands; PULSE always leaves the relay OFF
+        if self.relay_controller.pulse_relay(relay_num, duration_ms, RELAY_OFF):
+            return _RESP_OK
+        else:
+            return _RESP_HARDWARE_ERROR
+
+    def _cmd_info(self, parameters, parsed):
+        """INFO: board information including UID."""
+        return _RESP_INFO
+
+    def _cmd_uid(self, parameters, parsed):
+        """UID: unique identifier only."""
+        return _RESP_UID
+
+    def _cmd_version(self, parameters, parsed):
+        """VERSION: firmware version."""
+        return _RESP_VERSION
+
+    def _cmd_help(self, parameters, parsed):
+        """HELP: list available commands."""
+        return _RESP_HELP
+
+    def _cmd_name(self, parameters, parsed):
+        """NAME <relay> [<name>]: set or reset a relay name."""
+        relay_num = parsed[0]
+        # Without a name argument the name is cleared (empty string)
+        name = parameters[1] if len(parameters) == 2 else ""
+        if set_relay_name(relay_num, name):
+            return _RESP_OK
+        else:
+            return _RESP_HARDWARE_ERROR
+
+    def _cmd_get(self, parameters, parsed):
+        """GET NAME <relay>: get a relay name."""
+        if parameters[0] == "NAME":
+            name = get_relay_name(parsed[0])
+            return self.format_success_response(name)
+        else:
+            return _RESP_INVALID_PARAMETER
+
+    def _cmd_beep(self, parameters, parsed):
+        """BEEP [ms]: short beep (default 100ms)."""
+        # parsed holds the default duration when none was given
+        if self.relay_controller.buzzer_beep(parsed[0]):
+            return _RESP_OK
+        else:
+            return _RESP_HARDWARE_ERROR
+
+    def _cmd_buzz(self, parameters, parsed):
+        """BUZZ ON/OFF: continuous buzzer."""
+        operation = parameters[0]
+        if operation == "ON":
+            if self.relay_controller.buzzer_on():
+                return _RESP_OK
             else:
-                return self.format_error_response("SAVE_FAILED")
-
-        elif command == "LOAD":
-            # Load saved relay states from persistent storage
-            saved_states = load_relay_states()
-            if saved_states:
-                # Apply the saved states using set_states method
-                if self.relay_controller.set_states(saved_states):
-                    return self.format_success_response("LOADED")
-                else:
-                    return self.format_error_response("LOAD_FAILED")
+                return _RESP_HARDWARE_ERROR
+        elif operation == "OFF":
+            if self.relay_controller.buzzer_off():
+                return _RESP_OK
             else:
-                return self.format_error_response("NO_SAVED_STATE")
+                return _RESP_HARDWARE_ERROR
 
-        elif command == "CLEAR":
-            # Clear saved relay states from persistent storage
-            if clear_relay_states():
-                return self.format_success_response("CLEARED")
+    def _cmd_tone(self, parameters, parsed):
+        """TONE <hz> <ms>: play a tone."""
+        frequency, duration_ms = parsed
+        if self.relay_controller.buzzer_tone(frequency, duration_ms):
+            return _RESP_OK
+        else:
+            return _RESP_HARDWARE_ERROR
+
+    def _cmd_save(self, parameters, parsed):
+        """SAVE: persist current relay states."""
+        # Saved as a storage-order mask (MSB = relay 1)
+        mask = self.relay_controller.get_states_mask()
+        if mask is None:
+            return _RESP_HARDWARE_ERROR
+        if save_relay_states_fast(mask):
+            return _RESP_SAVED
+        else:
+            return self.format_error_response("SAVE_FAILED")
+
+    def _cmd_load(self, parameters, parsed):
+        """LOAD: restore saved relay states."""
+        saved_mask = load_relay_states_mask()
+        if saved_mask is not None:
+            # Apply the saved states using set_states method
+            if self.relay_controller.set_states(saved_mask):
+                return _RESP_LOADED
             else:
-                return self.format_error_response("CLEAR_FAILED")
+                return self.format_error_response("LOAD_FAILED")
+        else:
+            return self.format_error_response("NO_SAVED_STATE")
 
+    def _cmd_clear(self, parameters, parsed):
+        """CLEAR: clear saved relay states."""
+        if clear_relay_states():
+            return _RESP_CLEARED
         else:
-            return self.format_error_response("INVALID_COMMAND")
+            return self.format_error_response("CLEAR_FAILED")
 
     def get_statistics(self):
         """
         Get protocol statistics.
 
-        Useful for monitoring protocol performance and debugging.
+        Useful for monitoring protocol performance and debugging. The same
+        dictionary is updated in place and returned on every call, so callers
+        must not modify it or keep it expecting a snapshot.
 
         Returns:
             dict: Statistics containing:
@@ -614,12 +761,14 @@ class ProtocolParser:
                 - error_rate: Ratio of errors to commands
                 - last_command_time: Ticks timestamp of last command
         """
-        return {
-            "command_count": self.command_count,
-            "error_count": self.error_count,
-            "error_rate": self.error_count / max(self.command_count, 1),
-            "last_command_time": self.last_command_time,
-        }
+        stats = self._stats
+        command_count = self.command_count
+        stats["command_count"] = command_count
+        stats["error_count"] = self.error_count
+        # Skip the (soft-float) division when nothing has been processed
+        stats["error_rate"] = self.error_count / command_count if command_count else 0.0
+        stats["last_command_time"] = self.last_command_time
+        return stats
 
     def get_info(self):
         """
@@ -646,77 +795,5 @@ class ProtocolParser:
         self.error_count = 0
         self.last_command_time = 0
 
-        if DEBUG:
+        if _DEBUG:
             print("Protocol statistics reset")
-
-
-def test_protocol_parser():
-    """
-    Test function for protocol parser.
-
-    Runs basic validation tests without hardware. Useful for verifying
-    protocol implementation during development.
-    """
-    print("=== PROTOCOL PARSER TEST ===")
-
-    # Create parser without relay controller for basic testing
-    parser = ProtocolParser()
-
-    # Test command parsing
-    test_commands = [
-        "PING",
-        "ping",
-        "STATUS",
-        "ON 1",
-        "OFF 5",
-        "on 8",
-        "off 3",
-        "INVALID",
-        "ON",
-        "OFF 9",
-        "ON abc",
-        "",
-        "  PING  ",
-    ]
-
-    print("Testing command parsing and validation:")
-    for cmd in test_commands:
-        print(f"\nCommand: '{cmd}'")
-        command, params = parser.parse_command(cmd)
-        print(f"  Parsed: command='{command}', params={params}")
-
-        if command:
-            is_valid, error = parser.validate_command(command, params)
-            print(f"  Valid: {is_valid}, Error: {error}")
-
-    # Test response formatting
-    print("\nTesting response formatting:")
-    responses = [
-        parser.format_success_response(),
-        parser.format_success_response("PONG"),
-        parser.format_success_response("10101010"),
-        parser.format_error_response("INVALID_COMMAND"),
-        parser.format_error_response("INVALID_RELAY_NUMBER"),
-    ]
-
-    for resp in responses:
-        print(f"  Response: '{resp.strip()}'")
-
-    # Test command processing (without relay controller)
-    print("\nTesting command processing (no relay controller):")
-    test_cmds = ["PING", "STATUS", "ON 1", "INVALID"]
-    for cmd in test_cmds:
-        response = parser.process_command(cmd)
-        print(f"  '{cmd}' -> '{response.strip()}'")
-
-    # Show statistics
-    print("\nProtocol Statistics:")
-    stats = parser.get_statistics()
-    for key, value in stats.items():
-        print(f"  {key}: {value}")
-
-    print("\nProtocol parser test complete!")
-
-
-if __name__ == "__main__":
-    test_protocol_parser()
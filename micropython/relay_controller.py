@@ -20,7 +20,6 @@ from config import (
     BUZZER_DUTY_ON,
     BUZZER_FREQ_DEFAULT,
     BUZZER_PIN,
-    DEBUG,
     DEFAULT_RELAY_STATE,
     RELAY_COUNT,
     RELAY_OFF,
@@ -28,10 +27,65 @@ from config import (
     RELAY_PINS,
     RELAY_SETTLE_TIME,
     get_auto_load_enabled,
-    is_valid_relay_number,
-    load_relay_states,
+    load_relay_states_mask,
 )
-from machine import PWM, Pin
+from machine import PWM, Pin, Timer
+
+import micropython
+from micropython import const
+
+# Compile-time debug switch (mirrors config.DEBUG). As a module-local const()
+# the `if _DEBUG:` checks are removed from the bytecode entirely when False.
+_DEBUG = const(False)
+
+# RP2040 SIO GPIO_OUT_SET register (GPIO_OUT_CLR follows it): writing a mask
+# sets or clears those GPIO outputs in a single bus write
+_SIO_GPIO_OUT_SET = const(0xD0000014)
+
+
+def _reverse8(b):
+    """Reverse the bit order of an 8-bit int (swap nibbles, pairs, bits)."""
+    b = ((b & 0xF0) >> 4) | ((b & 0x0F) << 4)
+    b = ((b & 0xCC) >> 2) | ((b & 0x33) << 2)
+    return ((b & 0xAA) >> 1) | ((b & 0x55) << 1)
+
+
+# Bit-reversed value of every byte, so converting between storage order
+# (MSB = relay 1) and status order (bit 0 = relay 1) is one table index
+_BITREV8 = bytes(_reverse8(i) for i in range(256))
+
+# GPIO bit of each relay (index 0 = relay 1), for batched writes through the
+# SIO set/clear registers
+_PIN_BITS = tuple(1 << RELAY_PINS[n] for n in range(1, RELAY_COUNT + 1))
+
+
+@micropython.viper
+def _write_relay_pins(changed: int, mask: int):
+    """
+    Drive the relays flagged in changed to their state in mask.
+
+    Both arguments use status order (bit 0 = relay 1). Pins to switch ON and
+    OFF are collected into two GPIO masks, each written to the SIO
+    GPIO_OUT_SET / GPIO_OUT_CLR register in a single store.
+    """
+    set_bits = 0
+    clr_bits = 0
+    i = 0
+    while changed:
+        if changed & 1:
+            if mask & 1:
+                set_bits |= int(_PIN_BITS[i])
+            else:
+                clr_bits |= int(_PIN_BITS[i])
+        changed >>= 1
+        mask >>= 1
+        i += 1
+    sio = ptr32(_SIO_GPIO_OUT_SET)  # noqa: F821 (viper builtin)
+    if set_bits:
+        sio[0] = set_bits
+    if clr_bits:
+        # GPIO_OUT_CLR is the word after GPIO_OUT_SET
+        sio[1] = clr_bits
 
 
 class RelayController:
@@ -42,8 +96,6 @@ class RelayController:
     and integrates with persistent storage for state restoration.
 
     Attributes:
-        relays (dict): Mapping of relay numbers (1-8) to Pin objects
-        relay_states (list): Current state of each relay (RELAY_ON or RELAY_OFF)
         buzzer (PWM): PWM object for buzzer control, None if initialization fails
         buzzer_active (bool): True if buzzer is currently active
 
@@ -51,6 +103,8 @@ class RelayController:
         - Relay numbers are 1-indexed (1-8) for user convenience
         - All timing operations are limited to prevent watchdog timeouts
         - PWM resources are properly managed to prevent exhaustion
+        - Hot methods take module constants as underscore-prefixed default
+          arguments so they are local loads; callers never pass these
     """
 
     def __init__(self):
@@ -66,30 +120,40 @@ class RelayController:
         Raises:
             Exception: If relay pin initialization fails
         """
-        self.relays = {}
-        self.relay_states = [RELAY_OFF] * RELAY_COUNT
+        # Bound once so each delay is an attribute load, not a global lookup
+        # of time plus a method lookup
+        self._sleep_ms = time.sleep_ms
+        # Relay states packed into one int (bit 0 = relay 1); the tuple
+        # view and STATUS string are built on demand and reused until the
+        # next state change
+        self._state_bits = 0
+        self._states_view = None
+        self._status_binary = None
+        # Relays with a pulse in progress, and the state each returns to
+        # (bit 0 = relay 1); timers are created per relay on first use
+        self._pulse_bits = 0
+        self._pulse_end_bits = 0
+        self._pulse_timers = {}
         self._initialize_relays()
         self._initialize_buzzer()
 
         # Check for auto-load of saved states
         if get_auto_load_enabled():
-            saved_states = load_relay_states()
-            if (
-                saved_states and saved_states != "00000000"
-            ):  # Only load if not all zeros
+            saved_mask = load_relay_states_mask()
+            if saved_mask:  # Only load if not all zeros
                 try:
-                    self.set_states(saved_states)
-                    if DEBUG:
-                        print(f"Auto-loaded relay states: {saved_states}")
+                    self.set_states(saved_mask)
+                    if _DEBUG:
+                        print(f"Auto-loaded relay states: {saved_mask:08b}")
                 except Exception as e:
-                    if DEBUG:
+                    if _DEBUG:
                         print(f"Failed to auto-load relay states: {e}")
 
         # Boot beep to indicate system is ready
         if self.buzzer:
             self.buzzer_beep(150)  # Short boot beep
 
-        if DEBUG:
+        if _DEBUG:
             print("RelayController initialized")
 
     def _initialize_relays(self):
@@ -102,15 +166,17 @@ class RelayController:
         Raises:
             Exception: If any relay pin fails to initialize
         """
+        pins = [None] * RELAY_COUNT
         for relay_num, pin_num in RELAY_PINS.items():
             try:
                 # Create Pin object with OUTPUT mode
-                self.relays[relay_num] = Pin(pin_num, Pin.OUT)
+                pins[relay_num - 1] = Pin(pin_num, Pin.OUT)
                 # Set to default state (OFF)
-                self.relays[relay_num].value(DEFAULT_RELAY_STATE[relay_num - 1])
-                self.relay_states[relay_num - 1] = DEFAULT_RELAY_STATE[relay_num - 1]
+                pins[relay_num - 1].value(DEFAULT_RELAY_STATE[relay_num - 1])
+                if DEFAULT_RELAY_STATE[relay_num - 1]:
+                    self._state_bits |= 1 << (relay_num - 1)
 
-                if DEBUG:
+                if _DEBUG:
                     print(f"Relay {relay_num} initialized on GP{pin_num}")
 
             except Exception as e:
@@ -119,8 +185,14 @@ class RelayController:
                 )
                 raise
 
+        # Pin objects indexed by relay number - 1; a tuple index avoids the
+        # hash lookup a dict keyed by relay number would need
+        self._pins = tuple(pins)
+        # Bound Pin.value methods, so driving a relay is one index and a call
+        self._pin_value = tuple(pin.value for pin in pins)
+
         # Allow relays to settle
-        time.sleep_ms(RELAY_SETTLE_TIME)
+        self._sleep_ms(RELAY_SETTLE_TIME)
 
     def _initialize_buzzer(self):
         """
@@ -138,14 +210,55 @@ class RelayController:
             self.buzzer.duty_u16(BUZZER_DUTY_OFF)  # Start with buzzer off
             self.buzzer_active = False
 
-            if DEBUG:
+            if _DEBUG:
                 print(f"Buzzer initialized on GP{BUZZER_PIN}")
         except Exception as e:
             print(f"ERROR: Failed to initialize buzzer on GP{BUZZER_PIN}: {e}")
             self.buzzer = None
             self.buzzer_active = False
 
-    def relay_on(self, relay_num):
+    @micropython.native
+    def _drive(self, relay_num, state):
+        """
+        Drive one relay pin and record its state, without a settle delay.
+
+        Building block for single and bulk operations; callers validate the
+        relay number and sleep RELAY_SETTLE_TIME once when they are done.
+
+        Args:
+            relay_num (int): Relay number (1-8)
+            state (int): RELAY_ON or RELAY_OFF
+        """
+        self._pin_value[relay_num - 1](state)
+        if state:
+            self._state_bits |= 1 << (relay_num - 1)
+        else:
+            self._state_bits &= ~(1 << (relay_num - 1))
+        self._states_view = None
+        self._status_binary = None
+
+    def _cancel_pulses(self, bits):
+        """
+        Cancel the pending pulse timers of the relays in bits.
+
+        Called by the direct write paths before they touch a relay, so a
+        pulse started earlier cannot later override the newer command.
+
+        Args:
+            bits (int): Bitmask of relays being written (bit 0 = relay 1)
+        """
+        pending = self._pulse_bits & bits
+        if not pending:
+            return
+        self._pulse_bits &= ~pending
+        for relay_num in range(1, RELAY_COUNT + 1):
+            if pending & (1 << (relay_num - 1)):
+                self._pulse_timers[relay_num][0].deinit()
+
+    @micropython.native
+    def relay_on(
+        self, relay_num, _on=RELAY_ON, _count=RELAY_COUNT, _settle=RELAY_SETTLE_TIME
+    ):
         """
         Turn on a specific relay.
 
@@ -156,29 +269,35 @@ class RelayController:
             bool: True if successful, False if relay number invalid or hardware error
 
         Note:
-            Includes RELAY_SETTLE_TIME delay after state change
+            Includes RELAY_SETTLE_TIME delay after state change. A pulse
+            still pending on the relay is cancelled first.
         """
-        if not is_valid_relay_number(relay_num):
-            if DEBUG:
+        # Inline range check instead of a call to config.is_valid_relay_number
+        if not 0 < relay_num <= _count:
+            if _DEBUG:
                 print(f"ERROR: Invalid relay number: {relay_num}")
             return False
 
         try:
-            self.relays[relay_num].value(RELAY_ON)
-            self.relay_states[relay_num - 1] = RELAY_ON
+            if self._pulse_bits:
+                self._cancel_pulses(1 << (relay_num - 1))
+            self._drive(relay_num, _on)
 
-            if DEBUG:
+            if _DEBUG:
                 print(f"Relay {relay_num} turned ON")
 
             # Allow relay to settle
-            time.sleep_ms(RELAY_SETTLE_TIME)
+            self._sleep_ms(_settle)
             return True
 
         except Exception as e:
             print(f"ERROR: Failed to turn on relay {relay_num}: {e}")
             return False
 
-    def relay_off(self, relay_num):
+    @micropython.native
+    def relay_off(
+        self, relay_num, _off=RELAY_OFF, _count=RELAY_COUNT, _settle=RELAY_SETTLE_TIME
+    ):
         """
         Turn off a specific relay.
 
@@ -189,29 +308,31 @@ class RelayController:
             bool: True if successful, False if relay number invalid or hardware error
 
         Note:
-            Includes RELAY_SETTLE_TIME delay after state change
+            Includes RELAY_SETTLE_TIME delay after state change. A pulse
+            still pending on the relay is cancelled first.
         """
-        if not is_valid_relay_number(relay_num):
-            if DEBUG:
+        if not 0 < relay_num <= _count:
+            if _DEBUG:
                 print(f"ERROR: Invalid relay number: {relay_num}")
             return False
 
         try:
-            self.relays[relay_num].value(RELAY_OFF)
-            self.relay_states[relay_num - 1] = RELAY_OFF
+            if self._pulse_bits:
+                self._cancel_pulses(1 << (relay_num - 1))
+            self._drive(relay_num, _off)
 
-            if DEBUG:
+            if _DEBUG:
                 print(f"Relay {relay_num} turned OFF")
 
             # Allow relay to settle
-            time.sleep_ms(RELAY_SETTLE_TIME)
+            self._sleep_ms(_settle)
             return True
 
         except Exception as e:
             print(f"ERROR: Failed to turn off relay {relay_num}: {e}")
             return False
 
-    def get_relay_state(self, relay_num):
+    def get_relay_state(self, relay_num, _count=RELAY_COUNT):
         """
         Get the current state of a specific relay.
 
@@ -222,21 +343,28 @@ class RelayController:
             int or None: RELAY_ON (1) or RELAY_OFF (0) if valid relay,
                         None if relay number is invalid
         """
-        if not is_valid_relay_number(relay_num):
+        if not 0 < relay_num <= _count:
             return None
 
-        return self.relay_states[relay_num - 1]
+        return (self._state_bits >> (relay_num - 1)) & 1
 
     def get_all_states(self):
         """
         Get states of all relays.
 
         Returns:
-            list: List of relay states [relay1, relay2, ..., relay8]
-                  where each element is RELAY_ON (1) or RELAY_OFF (0)
-        """
-        return self.relay_states.copy()
-
+            tuple: Relay states (relay1, relay2, ..., relay8) where each
+                   element is RELAY_ON (1) or RELAY_OFF (0). The same tuple
+                   is returned until a relay changes state.
+        """
+        view = self._states_view
+        if view is None:
+            bits = self._state_bits
+            view = tuple((bits >> i) & 1 for i in range(RELAY_COUNT))
+            self._states_view = view
+        return view
+
+    @micropython.native
     def get_status_binary(self):
         """
         Get relay states as 8-bit binary string.
@@ -249,65 +377,74 @@ class RelayController:
                  - MSB (leftmost bit) = relay 8
                  - LSB (rightmost bit) = relay 1
                  - '1' = relay ON, '0' = relay OFF
+                 The string is cached until a relay changes state.
+        """
+        status = self._status_binary
+        if status is None:
+            status = f"{self._state_bits:08b}"
+            self._status_binary = status
+        return status
+
+    def get_status_mask(self):
         """
-        # Reverse the list so relay 8 is MSB
-        # Use single list comprehension to minimize memory allocations
-        return "".join(
-            str(self.relay_states[i]) for i in range(len(self.relay_states) - 1, -1, -1)
-        )
+        Get relay states as an 8-bit integer.
+
+        Returns:
+            int: Bitmask where bit 0 = relay 1 and bit 7 = relay 8, i.e. the
+                 same order as get_status_binary() (MSB = relay 8)
+        """
+        return self._state_bits
+
+    def get_states_mask(self):
+        """
+        Get relay states as an 8-bit integer in storage order.
+
+        Used by the SAVE protocol command.
+
+        Returns:
+            int: Bitmask with MSB = relay 1 and LSB = relay 8, the order used
+                 by set_states() and the saved states file
+        """
+        # Mirror the bits so relay 1 moves from bit 0 to the MSB
+        return _BITREV8[self._state_bits]
 
     def all_on(self):
         """
         Turn all relays ON.
 
-        Attempts to turn on all 8 relays in sequence. If any relay fails,
-        continues with remaining relays.
+        Switches all 8 relays with one SIO register write and a single
+        settle delay.
 
         Returns:
             bool: True if all relays turned on successfully,
-                  False if any relay failed
+                  False on hardware error
         """
-        success = True
-        for relay_num in range(1, RELAY_COUNT + 1):
-            if not self.relay_on(relay_num):
-                success = False
-
-        if DEBUG:
-            print(f"All relays turned ON: {'SUCCESS' if success else 'SOME FAILED'}")
-
-        return success
+        return self.set_mask(0xFF)
 
     def all_off(self):
         """
         Turn all relays OFF.
 
-        Attempts to turn off all 8 relays in sequence. If any relay fails,
-        continues with remaining relays.
+        Switches all 8 relays with one SIO register write and a single
+        settle delay.
 
         Returns:
             bool: True if all relays turned off successfully,
-                  False if any relay failed
+                  False on hardware error
         """
-        success = True
-        for relay_num in range(1, RELAY_COUNT + 1):
-            if not self.relay_off(relay_num):
-                success = False
-
-        if DEBUG:
-            print(f"All relays turned OFF: {'SUCCESS' if success else 'SOME FAILED'}")
-
-        return success
+        return self.set_mask(0)
 
     def set_states(self, states):
         """
-        Set relay states from a string pattern.
+        Set relay states from storage format.
 
         This method is used by the LOAD command and auto-load feature to restore
-        saved relay states. It converts from storage format to the format expected
-        by set_pattern().
+        saved relay states. It converts from storage format (relay 1 first) to
+        the mask expected by set_mask().
 
         Args:
-            states (str): 8-character string of relay states where:
+            states (int or str): Saved states, either as an 8-bit int with
+                         MSB = relay 1, or as an 8-character string where:
                          - states[0] corresponds to relay 1
                          - states[7] corresponds to relay 8
                          - '0' = relay OFF, '1' = relay ON
@@ -315,17 +452,70 @@ class RelayController:
 
         Returns:
             bool: True if successful, False if invalid format
+        """
+        if isinstance(states, str):
+            # Parse the string as one int (MSB = relay 1) instead of
+            # reversing it character by character
+            if (
+                len(states) != RELAY_COUNT
+                or states.count("0") + states.count("1") != RELAY_COUNT
+            ):
+                if _DEBUG:
+                    print(f"ERROR: Invalid saved states: {states}")
+                return False
+            states = int(states, 2)
 
-        Note:
-            Internally reverses the string to match set_pattern's MSB-first format
+        # Mirror the bits so relay 1 moves from the MSB to bit 0
+        return self.set_mask(_BITREV8[states & 0xFF])
+
+    @micropython.native
+    def set_mask(self, mask, _write=_write_relay_pins, _settle=RELAY_SETTLE_TIME):
         """
-        # Convert from storage format (relay 1 first) to pattern format (relay 8 first)
-        # Reverse the string to match set_pattern's expectation
-        # MicroPython doesn't support [::-1], so reverse manually
-        pattern = "".join(reversed(states))
-        return self.set_pattern(pattern)
+        Set relay states from an 8-bit integer.
+
+        Used by the SET protocol command after parsing its pattern. All
+        relays switch together: only relays whose state differs from the
+        current one are driven, the ON and OFF pins are each committed with
+        one write to the RP2040 SIO GPIO_OUT_SET / GPIO_OUT_CLR registers,
+        and a single RELAY_SETTLE_TIME delay follows. A mask matching the
+        current states touches no hardware at all. Pending pulses are
+        cancelled on every relay, since the mask sets all of them.
+
+        Args:
+            mask (int): Bitmask where bit 0 = relay 1 and bit 7 = relay 8
+                        (MSB = relay 8, as in get_status_mask())
+
+        Returns:
+            bool: True if all relays were set successfully,
+                  False on hardware error
+        """
+        mask &= 0xFF
+        # Cancel first so a pulse timer cannot write _state_bits between
+        # the assignment below and the pin write
+        if self._pulse_bits:
+            self._cancel_pulses(0xFF)
+        changed = mask ^ self._state_bits
+        if not changed:
+            return True
+        self._state_bits = mask
+        self._states_view = None
+        self._status_binary = None
+
+        try:
+            _write(changed, mask)
+
+            if _DEBUG:
+                print(f"Relay mask applied: {mask:08b}")
 
-    def set_pattern(self, pattern):
+            # Allow relays to settle
+            self._sleep_ms(_settle)
+            return True
+
+        except Exception as e:
+            print(f"ERROR: Failed to set relay mask: {e}")
+            return False
+
+    def set_pattern(self, pattern, _count=RELAY_COUNT):
         """
         Set relay states according to binary pattern.
 
@@ -342,35 +532,22 @@ class RelayController:
             bool: True if pattern applied successfully,
                   False if invalid format or any relay failed
         """
-        if not isinstance(pattern, str) or len(pattern) != 8:
-            if DEBUG:
+        # One length check and two C-level counts replace the per-character
+        # scan; int() alone would also accept a sign or underscores
+        if (
+            not isinstance(pattern, str)
+            or len(pattern) != _count
+            or pattern.count("0") + pattern.count("1") != _count
+        ):
+            if _DEBUG:
                 print(f"ERROR: Invalid pattern format: {pattern}")
             return False
 
-        # Validate pattern contains only 0s and 1s
-        if not all(c in "01" for c in pattern):
-            if DEBUG:
-                print(f"ERROR: Pattern contains invalid characters: {pattern}")
-            return False
-
         try:
-            # Convert pattern to list of states
-            # Pattern is MSB first, so reverse it
-            # Use list comprehension to avoid string concatenation
-            states = [int(pattern[i]) for i in range(len(pattern) - 1, -1, -1)]
-
-            success = True
-            for relay_num in range(1, RELAY_COUNT + 1):
-                desired_state = states[relay_num - 1]
-
-                if desired_state == RELAY_ON:
-                    if not self.relay_on(relay_num):
-                        success = False
-                else:
-                    if not self.relay_off(relay_num):
-                        success = False
+            # Pattern is MSB first (relay 8), matching set_mask's bit order
+            success = self.set_mask(int(pattern, 2))
 
-            if DEBUG:
+            if _DEBUG:
                 print(
                     f"Pattern {pattern} applied: {'SUCCESS' if success else 'SOME FAILED'}"
                 )
@@ -391,60 +568,87 @@ class RelayController:
             bool: True if all relays reset successfully,
                   False if any relay failed
         """
-        if DEBUG:
+        if _DEBUG:
             print("Resetting all relays to OFF")
 
         return self.all_off()
 
-    def pulse_relay(self, relay_num, duration_ms):
+    def pulse_relay(self, relay_num, duration_ms, end_state=None):
         """
-        Pulse a relay (turn on for specified duration then off).
+        Pulse a relay (turn on for specified duration then back).
 
-        Used by the PULSE protocol command. After the pulse, the relay returns
-        to its original state (not necessarily OFF).
+        Used by the PULSE protocol command. The relay is switched ON and the
+        call returns immediately; a one-shot machine.Timer drives it to
+        end_state when the duration expires, so the caller keeps running
+        during the pulse and several relays can pulse at once. Pulsing a
+        relay that is still pulsing restarts its timer. A later relay_on,
+        relay_off or set_mask (ALL, SET, LOAD, reset) on the relay cancels
+        the pending timer, so the newer command wins.
 
         Args:
             relay_num (int): Relay number (1-8)
-            duration_ms (int): Duration in milliseconds (max 5000ms for watchdog safety)
+            duration_ms (int): Duration in milliseconds (max 5000ms)
+            end_state (int, optional): RELAY_ON or RELAY_OFF to leave the
+                relay in afterwards. If None, the relay returns to the state
+                it had before the pulse (not necessarily OFF).
 
         Returns:
-            bool: True if pulse completed successfully,
+            bool: True if the pulse was started,
                   False if invalid parameters or hardware error
-
-        Note:
-            Duration is limited to 5 seconds to prevent watchdog timeouts
         """
-        if not is_valid_relay_number(relay_num):
-            if DEBUG:
+        if not 0 < relay_num <= RELAY_COUNT:
+            if _DEBUG:
                 print(f"ERROR: Invalid relay number: {relay_num}")
             return False
 
         if duration_ms <= 0:
-            if DEBUG:
+            if _DEBUG:
                 print(f"ERROR: Invalid duration: {duration_ms}")
             return False
 
         try:
-            # Store original state
-            original_state = self.relay_states[relay_num - 1]
-
-            # Turn on
-            if not self.relay_on(relay_num):
-                return False
+            bit = 1 << (relay_num - 1)
+            if end_state is None:
+                # A restarted pulse keeps the state from before the first one
+                if not self._pulse_bits & bit:
+                    end_state = self._state_bits & bit
+                else:
+                    end_state = self._pulse_end_bits & bit
+            if end_state:
+                self._pulse_end_bits |= bit
+            else:
+                self._pulse_end_bits &= ~bit
+            self._pulse_bits |= bit
 
-            # Wait for duration
-            time.sleep_ms(duration_ms)
+            # Turn on; the pulse duration doubles as the settle time
+            self._drive(relay_num, RELAY_ON)
 
-            # Return to original state
-            if original_state == RELAY_ON:
-                return self.relay_on(relay_num)
-            else:
-                return self.relay_off(relay_num)
+            pulse = self._pulse_timers.get(relay_num)
+            if pulse is None:
+                pulse = (Timer(), self._make_pulse_end(relay_num))
+                self._pulse_timers[relay_num] = pulse
+            pulse[0].init(mode=Timer.ONE_SHOT, period=duration_ms, callback=pulse[1])
+            return True
 
         except Exception as e:
             print(f"ERROR: Failed to pulse relay {relay_num}: {e}")
             return False
 
+    def _make_pulse_end(self, relay_num):
+        """Build the timer callback that ends a pulse on relay_num."""
+        bit = 1 << (relay_num - 1)
+
+        def pulse_end(timer):
+            # A callback already scheduled when the pulse was cancelled
+            if not self._pulse_bits & bit:
+                return
+            self._pulse_bits &= ~bit
+            self._drive(
+                relay_num, RELAY_ON if self._pulse_end_bits & bit else RELAY_OFF
+            )
+
+        return pulse_end
+
     def get_info(self):
         """
         Get controller information.
@@ -455,65 +659,71 @@ class RelayController:
             dict: Controller information containing:
                 - relay_count: Number of relays (8)
                 - relay_pins: GPIO pin mappings
-                - current_states: List of current relay states
+                - current_states: Tuple of current relay states
                 - status_binary: Binary string representation
         """
         return {
             "relay_count": RELAY_COUNT,
             "relay_pins": RELAY_PINS,
-            "current_states": self.relay_states.copy(),
+            "current_states": self.get_all_states(),
             "status_binary": self.get_status_binary(),
         }
 
-    def self_test(self):
+    def self_test(self, verbose=False):
         """
         Perform self-test of all relays.
 
-        Tests each relay by turning it ON, verifying state, turning it OFF,
-        and verifying state again. Useful for hardware verification.
+        By default all relays are switched ON together and then OFF together
+        through the bulk SIO writer, checking the tracked state after each
+        step (two settle delays in total). With verbose=True each relay is
+        instead switched ON and OFF on its own with its own settle delay, and
+        failures are reported per relay, for isolating a hardware fault.
+
+        Args:
+            verbose (bool): Test and report relays one at a time
 
         Returns:
             bool: True if all relays pass ON/OFF state verification,
                   False if any relay fails
-
-        Note:
-            This operation takes several seconds as each relay is tested
-            individually with settle time delays
         """
-        if DEBUG:
+        if _DEBUG:
             print("Starting relay self-test...")
 
-        success = True
+        if verbose:
+            success = self._self_test_each()
+        else:
+            success = self.all_on() and self._state_bits == 0xFF
+            success = self.all_off() and self._state_bits == 0 and success
 
-        # Test each relay individually
-        for relay_num in range(1, RELAY_COUNT + 1):
-            if DEBUG:
-                print(f"Testing relay {relay_num}...")
+        if _DEBUG:
+            print(f"Self-test completed: {'PASSED' if success else 'FAILED'}")
 
-            # Test on
-            if not self.relay_on(relay_num):
-                success = False
-                continue
+        return success
 
-            # Verify state
-            if self.get_relay_state(relay_num) != RELAY_ON:
-                if DEBUG:
-                    print(f"ERROR: Relay {relay_num} state verification failed (ON)")
-                success = False
+    def _self_test_each(self):
+        """
+        Test relays one at a time for self_test(verbose=True).
 
-            # Test off
-            if not self.relay_off(relay_num):
-                success = False
-                continue
+        Returns:
+            bool: True if every relay switched ON and back OFF
+        """
+        success = True
+        for relay_num in range(1, RELAY_COUNT + 1):
+            print(f"Testing relay {relay_num}...")
 
-            # Verify state
-            if self.get_relay_state(relay_num) != RELAY_OFF:
-                if DEBUG:
-                    print(f"ERROR: Relay {relay_num} state verification failed (OFF)")
+            if (
+                not self.relay_on(relay_num)
+                or self.get_relay_state(relay_num) != RELAY_ON
+            ):
+                print(f"ERROR: Relay {relay_num} state verification failed (ON)")
                 success = False
 
-        if DEBUG:
-            print(f"Self-test completed: {'PASSED' if success else 'FAILED'}")
+            if (
+                not self.relay_off(relay_num)
+                or self.get_relay_state(relay_num) != RELAY_OFF
+            ):
+                print(f"ERROR: Relay {relay_num} state verification failed (OFF)")
+                success = False
 
         return success
 
@@ -541,7 +751,7 @@ class RelayController:
             self.buzzer.duty_u16(BUZZER_DUTY_ON)
             self.buzzer_active = True
 
-            if DEBUG:
+            if _DEBUG:
                 print(f"Buzzer ON at {frequency}Hz")
             return True
         except Exception as e:
@@ -552,15 +762,39 @@ class RelayController:
         """
         Turn buzzer off.
 
-        Used by the BUZZ OFF protocol command. Properly releases PWM resources
-        to prevent exhaustion during rapid on/off cycles.
+        Used by the BUZZ OFF protocol command and at the end of every beep
+        and tone. Only the duty cycle is cleared; the PWM slice stays
+        configured, so rapid on/off cycles allocate nothing.
 
         Returns:
             bool: True if buzzer turned off successfully,
                   False if buzzer not available or error
+        """
+        if not self.buzzer:
+            return False
 
-        Note:
-            Deinitializes and reinitializes PWM to prevent resource leaks
+        try:
+            self.buzzer.duty_u16(BUZZER_DUTY_OFF)
+            self.buzzer_active = False
+
+            if _DEBUG:
+                print("Buzzer OFF")
+            return True
+        except Exception as e:
+            print(f"ERROR: Failed to turn buzzer off: {e}")
+            return False
+
+    def buzzer_release(self):
+        """
+        Silence the buzzer and reinitialize its PWM slice.
+
+        Deinitializes the PWM hardware and creates a fresh PWM object at the
+        default frequency. Not needed for normal on/off use; intended for an
+        explicit reset or after the buzzer has been idle for a long time.
+
+        Returns:
+            bool: True if the PWM was reinitialized successfully,
+                  False if buzzer not available or error
         """
         if not self.buzzer:
             return False
@@ -575,11 +809,11 @@ class RelayController:
             self.buzzer.freq(BUZZER_FREQ_DEFAULT)
             self.buzzer.duty_u16(BUZZER_DUTY_OFF)
 
-            if DEBUG:
-                print("Buzzer OFF")
+            if _DEBUG:
+                print("Buzzer PWM released")
             return True
         except Exception as e:
-            print(f"ERROR: Failed to turn buzzer off: {e}")
+            print(f"ERROR: Failed to release buzzer: {e}")
             return False
 
     def buzzer_beep(self, duration_ms=100, frequency=None):
@@ -601,7 +835,7 @@ class RelayController:
 
         try:
             self.buzzer_on(frequency)
-            time.sleep_ms(duration_ms)
+            self._sleep_ms(duration_ms)
             self.buzzer_off()
             return True
         except Exception as e:
@@ -630,7 +864,7 @@ class RelayController:
 
         try:
             self.buzzer_on(frequency)
-            time.sleep_ms(duration_ms)
+            self._sleep_ms(duration_ms)
             self.buzzer_off()
             return True
         except Exception as e:
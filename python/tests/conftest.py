@@ -6,12 +6,31 @@ import os
 from unittest.mock import Mock
 
 import pytest
+import serial
 from waveshare_relay import RelayController, find_relay_board
+from waveshare_relay.controller import _LineReader
 
 # Hardware testing configuration
 HARDWARE_TEST = os.environ.get("HARDWARE_TEST", "false").lower() == "true"
 
 
+def pytest_configure(config):
+    """Register the markers that split mocked and hardware test runs"""
+    config.addinivalue_line("markers", "hw_only: run only with HARDWARE_TEST=true")
+    config.addinivalue_line("markers", "mock_only: skip when HARDWARE_TEST=true")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip hw_only tests in mocked runs and mock_only tests on hardware"""
+    if HARDWARE_TEST:
+        marker, skip = "mock_only", pytest.mark.skip(reason="mock only")
+    else:
+        marker, skip = "hw_only", pytest.mark.skip(reason="hw required")
+    for item in items:
+        if marker in item.keywords:
+            item.add_marker(skip)
+
+
 def find_hardware_port():
     """Find connected Pico board for hardware testing using auto-discovery"""
     if not HARDWARE_TEST:
@@ -30,18 +49,34 @@ def find_hardware_port():
     return port
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def mock_serial():
-    """Mock serial.Serial object for testing"""
-    mock = Mock()
+    """Mock serial.Serial object shared across a test class"""
+    mock = Mock(spec=serial.Serial)
     mock.is_open = True
-    mock.write = Mock()
-    mock.flush = Mock()
-    mock.readline = Mock()
-    mock.close = Mock()
     return mock
 
 
+@pytest.fixture(autouse=True)
+def _reset_mock_serial(mock_serial):
+    """Clear calls, return values and side effects between tests"""
+    yield
+    mock_serial.reset_mock(return_value=True, side_effect=True)
+    mock_serial.is_open = True
+
+
+@pytest.fixture(scope="class")
+def fresh_controller_factory():
+    """Build unconnected RelayControllers on /dev/test for tests that mutate them"""
+    return lambda **kwargs: RelayController("/dev/test", **kwargs)
+
+
+@pytest.fixture(scope="class")
+def base_controller():
+    """One unconnected RelayController with defaults, for read-only tests"""
+    return RelayController("/dev/test")
+
+
 @pytest.fixture
 def controller():
     """Create a RelayController instance for testing"""
@@ -67,7 +102,10 @@ def connected_controller(controller, mock_serial):
         controller.all_relays_off()
         controller.disconnect()
     else:
-        # Use mocked connection
+        # Use mocked connection; tests script mock_serial.read() and
+        # in_waiting, which the controller's line reader consumes
+        mock_serial.in_waiting = 0
         controller.serial = mock_serial
+        controller._reader = _LineReader(mock_serial)
         controller.connected = True
         yield controller
@@ -2,29 +2,53 @@
 Tests for the RelayController class
 """
 
-import os
 from unittest.mock import Mock, patch
 
 import pytest
 import serial
-from waveshare_relay.controller import RelayController
+from waveshare_relay.controller import CONNECTION_TIMEOUT, _LineReader
 from waveshare_relay.exceptions import (
     RelayCommandError,
     RelayConnectionError,
     RelayTimeoutError,
+    RelayValidationError,
 )
 
+# Common serial responses
+_OK = b"OK\r\n"
+_PONG = b"PONG\r\n"
+_ERR_INVALID = b"ERROR:INVALID_COMMAND\r\n"
+_EMPTY = b""
+
+# STATUS response followed by GET NAME 1..8 responses
+_DICT_SIDE_EFFECT = (b"10101010\r\n", b"LIGHT1\r\n", b"LIGHT2\r\n") + (b"\r\n",) * 6
+# STATUS response, GET NAME 1 error, then empty names
+_DICT_ERROR_SIDE_EFFECT = (b"00000000\r\n", _ERR_INVALID) + (b"\r\n",) * 7
+
+
+# (method, args, expected write) for commands that only expect OK back
+_SIMPLE_COMMANDS = [
+    ("relay_on", (1,), b"ON 1\n"),
+    ("relay_off", (3,), b"OFF 3\n"),
+    ("all_relays_on", (), b"ALL ON\n"),
+    ("all_relays_off", (), b"ALL OFF\n"),
+    ("set_relay_pattern", ("10101010",), b"SET 10101010\n"),
+    ("pulse_relay", (1, 500), b"PULSE 1 500\n"),
+    ("set_relay_name", (1, "LIGHTS"), b"NAME 1 LIGHTS\n"),
+    ("beep", (), b"BEEP\n"),
+    ("beep", (500,), b"BEEP 500\n"),
+    ("buzzer_on", (), b"BUZZ ON\n"),
+    ("buzzer_off", (), b"BUZZ OFF\n"),
+    ("tone", (1000, 500), b"TONE 1000 500\n"),
+]
+
 
 class TestRelayController:
     """Test cases for RelayController class"""
 
-    def _is_hardware_test(self):
-        """Check if running hardware tests"""
-        return os.environ.get("HARDWARE_TEST", "false").lower() == "true"
-
-    def test_init(self):
+    def test_init(self, fresh_controller_factory):
         """Test RelayController initialization"""
-        controller = RelayController("/dev/test", baudrate=9600, timeout=2.0)
+        controller = fresh_controller_factory(baudrate=9600, timeout=2.0)
 
         assert controller.port == "/dev/test"
         assert controller.baudrate == 9600
@@ -33,22 +57,24 @@ class TestRelayController:
         assert controller.connected is False
         assert controller.protocol is not None
 
-    def test_init_defaults(self):
+    def test_init_defaults(self, base_controller):
         """Test RelayController initialization with defaults"""
-        controller = RelayController("/dev/test")
+        controller = base_controller
 
         assert controller.port == "/dev/test"
         assert controller.baudrate == 115200
         assert controller.timeout == 1.0
+        assert controller.flush is False
+        assert controller.low_latency is False
 
     @patch("waveshare_relay.controller.serial.Serial")
-    def test_connect_success(self, mock_serial_class):
+    def test_connect_success(self, mock_serial_class, fresh_controller_factory):
         """Test successful connection"""
         # Mock serial instance
         mock_serial = Mock()
         mock_serial_class.return_value = mock_serial
 
-        controller = RelayController("/dev/test")
+        controller = fresh_controller_factory()
 
         # Mock successful ping
         with patch.object(controller, "ping", return_value=True):
@@ -60,43 +86,96 @@ class TestRelayController:
         mock_serial_class.assert_called_once_with(
             port="/dev/test", baudrate=115200, timeout=1.0
         )
+        # Timeout restored after the blocking connection PING
+        assert mock_serial.timeout == 1.0
 
+    @pytest.mark.parametrize("error", [None, AttributeError, OSError])
     @patch("waveshare_relay.controller.serial.Serial")
-    def test_connect_ping_timeout(self, mock_serial_class):
+    def test_connect_low_latency(
+        self, mock_serial_class, error, fresh_controller_factory
+    ):
+        """Test low_latency requests driver low-latency mode, tolerating no support"""
+        mock_serial = Mock()
+        mock_serial.set_low_latency_mode.side_effect = error
+        mock_serial_class.return_value = mock_serial
+
+        controller = fresh_controller_factory(low_latency=True)
+
+        with patch.object(controller, "ping", return_value=True):
+            controller.connect()
+
+        assert controller.connected is True
+        mock_serial.set_low_latency_mode.assert_called_once_with(True)
+
+    @patch("waveshare_relay.controller.serial.Serial")
+    def test_connect_retries_after_dropped_ping(
+        self, mock_serial_class, monkeypatch, fresh_controller_factory
+    ):
+        """Test connect falls back to polling when the first PING is lost"""
+        mock_serial_class.return_value = Mock()
+
+        controller = fresh_controller_factory()
+
+        # The first PING is dropped and blocks for the whole timeout
+        clock = [0.0]
+        pings = []
+        replies = iter([False, True])
+
+        def ping():
+            if not pings:
+                clock[0] += CONNECTION_TIMEOUT
+            pings.append(clock[0])
+            return next(replies)
+
+        monkeypatch.setattr(controller, "ping", ping)
+        monkeypatch.setattr("time.time", lambda: clock[0])
+        monkeypatch.setattr("time.sleep", lambda _: None)
+
+        controller.connect()
+
+        assert controller.connected is True
+        assert len(pings) == 2
+
+    @patch("waveshare_relay.controller.serial.Serial")
+    def test_connect_ping_timeout(
+        self, mock_serial_class, monkeypatch, fresh_controller_factory
+    ):
         """Test connection timeout when ping fails"""
         mock_serial = Mock()
         mock_serial_class.return_value = mock_serial
 
-        controller = RelayController("/dev/test")
+        controller = fresh_controller_factory()
 
-        # Mock failed ping
-        with (
-            patch.object(controller, "ping", return_value=False),
-            patch("time.time", side_effect=[0, 6]),  # Simulate timeout
-            pytest.raises(
-                RelayConnectionError,
-                match="Board not responding to PING after timeout",
-            ),
+        # Mock failed ping and simulate timeout
+        monkeypatch.setattr(controller, "ping", lambda: False)
+        times = iter([0, 6])
+        monkeypatch.setattr("time.time", lambda: next(times))
+
+        with pytest.raises(
+            RelayConnectionError,
+            match="Board not responding to PING after timeout",
         ):
             controller.connect()
 
         assert controller.connected is False
 
     @patch("waveshare_relay.controller.serial.Serial")
-    def test_connect_serial_exception(self, mock_serial_class):
+    def test_connect_serial_exception(
+        self, mock_serial_class, fresh_controller_factory
+    ):
         """Test connection with serial exception"""
         mock_serial_class.side_effect = serial.SerialException("Port not found")
 
-        controller = RelayController("/dev/test")
+        controller = fresh_controller_factory()
 
         with pytest.raises(
             RelayConnectionError, match="Failed to connect to /dev/test"
         ):
             controller.connect()
 
-    def test_disconnect(self):
+    def test_disconnect(self, fresh_controller_factory):
         """Test disconnection"""
-        controller = RelayController("/dev/test")
+        controller = fresh_controller_factory()
         mock_serial = Mock()
         mock_serial.is_open = True
         controller.serial = mock_serial
@@ -107,24 +186,22 @@ class TestRelayController:
         assert controller.connected is False
         mock_serial.close.assert_called_once()
 
-    def test_disconnect_no_serial(self):
+    def test_disconnect_no_serial(self, fresh_controller_factory):
         """Test disconnection with no serial connection"""
-        controller = RelayController("/dev/test")
+        controller = fresh_controller_factory()
         controller.connected = True
 
         # Should not raise exception
         controller.disconnect()
         assert controller.connected is False
 
-    def test_context_manager(self):
+    def test_context_manager(self, mocker, fresh_controller_factory):
         """Test context manager functionality"""
-        controller = RelayController("/dev/test")
+        controller = fresh_controller_factory()
+        mock_connect = mocker.patch.object(controller, "connect")
+        mock_disconnect = mocker.patch.object(controller, "disconnect")
 
-        with (
-            patch.object(controller, "connect") as mock_connect,
-            patch.object(controller, "disconnect") as mock_disconnect,
-            controller,
-        ):
+        with controller:
             pass
 
         mock_connect.assert_called_once()
@@ -135,395 +212,387 @@ class TestRelayController:
         with pytest.raises(RelayConnectionError, match="Not connected to relay board"):
             controller._send_command("PING")
 
-    def test_send_command_success(self, connected_controller, mock_serial):
+    @pytest.mark.hw_only
+    def test_send_command_success_hw(self, connected_controller):
+        """Test successful command sending with real hardware"""
+        result = connected_controller._send_command("PING")
+        assert result == "PONG"
+
+    @pytest.mark.mock_only
+    def test_send_command_success_mock(self, connected_controller, mock_serial):
         """Test successful command sending"""
-        if os.environ.get("HARDWARE_TEST", "false").lower() == "true":
-            # Test with real hardware
-            result = connected_controller._send_command("PING")
-            assert result == "PONG"
-        else:
-            # Mock successful response
-            mock_serial.readline.return_value = b"PONG\r\n"
+        mock_serial.in_waiting = len(_PONG)
+        mock_serial.read.return_value = _PONG
+
+        result = connected_controller._send_command("PING")
+
+        assert result == "PONG"
+        mock_serial.write.assert_called_once_with(b"PING\n")
+        mock_serial.flush.assert_not_called()
+        mock_serial.read.assert_called_once_with(len(_PONG))
+
+    @pytest.mark.mock_only
+    def test_send_command_flush(self, connected_controller, mock_serial):
+        """Test flush=True drains the port after each command"""
+        connected_controller.flush = True
+        mock_serial.read.return_value = _PONG
 
-            result = connected_controller._send_command("PING")
+        connected_controller._send_command("PING")
 
-            assert result == "PONG"
-            mock_serial.write.assert_called_once_with(b"PING\n")
-            mock_serial.flush.assert_called_once()
-            mock_serial.readline.assert_called_once()
+        mock_serial.flush.assert_called_once()
 
+    @pytest.mark.mock_only
     def test_send_command_timeout(self, connected_controller, mock_serial):
         """Test command timeout"""
-        if os.environ.get("HARDWARE_TEST", "false").lower() == "true":
-            # Skip timeout test with real hardware - would take too long
-            pytest.skip("Timeout test not applicable for hardware testing")
-        else:
-            # Mock timeout (empty response)
-            mock_serial.readline.return_value = b""
-
-            with pytest.raises(
-                RelayTimeoutError, match="Timeout waiting for response to PING"
-            ):
-                connected_controller._send_command("PING")
+        # Mock timeout (empty response)
+        mock_serial.read.return_value = _EMPTY
 
+        with pytest.raises(
+            RelayTimeoutError, match="Timeout waiting for response to PING"
+        ):
+            connected_controller._send_command("PING")
+
+    @pytest.mark.mock_only
     def test_send_command_error_response(self, connected_controller, mock_serial):
         """Test command with error response"""
-        if self._is_hardware_test():
-            # Skip error response test with real hardware - error handling is tested elsewhere
-            pytest.skip("Error response test not applicable for hardware testing")
-        else:
-            # Mock error response
-            mock_serial.readline.return_value = b"ERROR:INVALID_COMMAND\r\n"
-
-            with pytest.raises(
-                RelayCommandError, match="Command PING failed: INVALID_COMMAND"
-            ):
-                connected_controller._send_command("PING")
+        mock_serial.read.return_value = _ERR_INVALID
 
+        with pytest.raises(
+            RelayCommandError, match="Command PING failed: INVALID_COMMAND"
+        ):
+            connected_controller._send_command("PING")
+
+    @pytest.mark.mock_only
     def test_send_command_serial_exception(self, connected_controller, mock_serial):
         """Test command with serial exception"""
-        if os.environ.get("HARDWARE_TEST", "false").lower() == "true":
-            # Skip serial exception test with real hardware
-            pytest.skip("Serial exception test not applicable for hardware testing")
-        else:
-            mock_serial.write.side_effect = serial.SerialException("Connection lost")
-
-            with pytest.raises(
-                RelayConnectionError, match="Serial communication error"
-            ):
-                connected_controller._send_command("PING")
-
-    def test_ping_success(self, connected_controller, mock_serial):
+        mock_serial.write.side_effect = serial.SerialException("Connection lost")
+
+        with pytest.raises(RelayConnectionError, match="Serial communication error"):
+            connected_controller._send_command("PING")
+
+    @pytest.mark.hw_only
+    def test_ping_success_hw(self, connected_controller):
+        """Test successful ping with real hardware"""
+        assert connected_controller.ping() is True
+
+    @pytest.mark.mock_only
+    def test_ping_success_mock(self, connected_controller, mock_serial):
         """Test successful ping"""
-        if os.environ.get("HARDWARE_TEST", "false").lower() == "true":
-            # Test with real hardware
-            result = connected_controller.ping()
-            assert result is True
-        else:
-            mock_serial.readline.return_value = b"PONG\r\n"
+        mock_serial.read.return_value = _PONG
 
-            result = connected_controller.ping()
-            assert result is True
+        result = connected_controller.ping()
+        assert result is True
 
+    @pytest.mark.mock_only
     def test_ping_failure(self, connected_controller, mock_serial):
         """Test ping failure"""
-        if os.environ.get("HARDWARE_TEST", "false").lower() == "true":
-            # Skip ping failure test with real hardware - ping should always work
-            pytest.skip("Ping failure test not applicable for hardware testing")
-        else:
-            mock_serial.readline.return_value = b"ERROR:INVALID_COMMAND\r\n"
-
-            result = connected_controller.ping()
-            assert result is False
-
-    def test_get_info(self, connected_controller, mock_serial):
+        mock_serial.read.return_value = _ERR_INVALID
+
+        result = connected_controller.ping()
+        assert result is False
+
+    @pytest.mark.hw_only
+    def test_get_info_hw(self, connected_controller):
+        """Test get_info command with real hardware"""
+        info = connected_controller.get_info()
+        # Just verify we get a valid info dict with required keys
+        assert isinstance(info, dict)
+        assert "board_name" in info
+        # Don't check exact values as they may vary by hardware
+
+    @pytest.mark.mock_only
+    def test_get_info_mock(self, connected_controller, mock_serial):
         """Test get_info command"""
-        if os.environ.get("HARDWARE_TEST", "false").lower() == "true":
-            # Test with real hardware
-            info = connected_controller.get_info()
-            # Just verify we get a valid info dict with required keys
-            assert isinstance(info, dict)
-            assert "board_name" in info
-            # Don't check exact values as they may vary by hardware
-        else:
-            mock_serial.readline.return_value = (
-                b"WAVESHARE-PICO-RELAY-B,V1.0,8CH,UID:1234\r\n"
-            )
-
-            info = connected_controller.get_info()
-
-            expected = {
-                "board_name": "WAVESHARE-PICO-RELAY-B",
-                "version": "V1.0",
-                "channels": "8CH",
-                "uid": "1234",
-            }
-            assert info == expected
-
-    def test_get_uid(self, connected_controller, mock_serial):
+        mock_serial.read.return_value = b"WAVESHARE-PICO-RELAY-B,V1.0,8CH,UID:1234\r\n"
+
+        info = connected_controller.get_info()
+
+        expected = {
+            "board_name": "WAVESHARE-PICO-RELAY-B",
+            "version": "V1.0",
+            "channels": "8CH",
+            "uid": "1234",
+        }
+        assert info == expected
+
+    @pytest.mark.hw_only
+    def test_get_uid_hw(self, connected_controller):
+        """Test get_uid command with real hardware"""
+        uid = connected_controller.get_uid()
+        # Just verify we get a non-empty UID string
+        assert isinstance(uid, str)
+        assert len(uid) > 0
+
+    @pytest.mark.mock_only
+    def test_get_uid_mock(self, connected_controller, mock_serial):
         """Test get_uid command"""
-        if os.environ.get("HARDWARE_TEST", "false").lower() == "true":
-            # Test with real hardware
-            uid = connected_controller.get_uid()
-            # Just verify we get a non-empty UID string
-            assert isinstance(uid, str)
-            assert len(uid) > 0
-        else:
-            mock_serial.readline.return_value = b"ECD43B7502A23159\r\n"
-
-            uid = connected_controller.get_uid()
-            assert uid == "ECD43B7502A23159"
-
-    def test_get_status(self, connected_controller, mock_serial):
+        mock_serial.read.return_value = b"ECD43B7502A23159\r\n"
+
+        uid = connected_controller.get_uid()
+        assert uid == "ECD43B7502A23159"
+
+    @pytest.mark.hw_only
+    def test_get_status_hw(self, connected_controller):
+        """Test get_status command with real hardware"""
+        status = connected_controller.get_status()
+        # Just verify we get a valid status dict
+        assert isinstance(status, dict)
+        assert len(status) == 8
+        for i in range(1, 9):
+            assert i in status
+            assert isinstance(status[i], bool)
+
+    @pytest.mark.mock_only
+    def test_get_status_mock(self, connected_controller, mock_serial):
         """Test get_status command"""
-        if os.environ.get("HARDWARE_TEST", "false").lower() == "true":
-            # Test with real hardware
-            status = connected_controller.get_status()
-            # Just verify we get a valid status dict
-            assert isinstance(status, dict)
-            assert len(status) == 8
-            for i in range(1, 9):
-                assert i in status
-                assert isinstance(status[i], bool)
-        else:
-            mock_serial.readline.return_value = b"10101010\r\n"
-
-            status = connected_controller.get_status()
-
-            expected = {
-                1: False,
-                2: True,
-                3: False,
-                4: True,
-                5: False,
-                6: True,
-                7: False,
-                8: True,
-            }
-            assert status == expected
-
-    def test_relay_on(self, connected_controller, mock_serial):
-        """Test relay_on command"""
-        if os.environ.get("HARDWARE_TEST", "false").lower() == "true":
-            # Test with real hardware - verify relay actually turns on
-            import time
-
-            connected_controller.relay_off(1)  # Start with relay off
-            time.sleep(0.1)
-            connected_controller.relay_on(1)
-            time.sleep(0.1)
-            status = connected_controller.get_status()
-            assert status[1] is True
-        else:
-            mock_serial.readline.return_value = b"OK\r\n"
-            connected_controller.relay_on(1)
-            mock_serial.write.assert_called_with(b"ON 1\n")
-
-    def test_relay_off(self, connected_controller, mock_serial):
-        """Test relay_off command"""
-        if os.environ.get("HARDWARE_TEST", "false").lower() == "true":
-            # Test with real hardware - verify relay actually turns off
-            import time
-
-            connected_controller.relay_on(3)  # Start with relay on
-            time.sleep(0.1)
-            connected_controller.relay_off(3)
-            time.sleep(0.1)
-            status = connected_controller.get_status()
-            assert status[3] is False
-        else:
-            mock_serial.readline.return_value = b"OK\r\n"
-            connected_controller.relay_off(3)
-            mock_serial.write.assert_called_with(b"OFF 3\n")
-
-    def test_all_relays_on(self, connected_controller, mock_serial):
-        """Test all_relays_on command"""
-        if os.environ.get("HARDWARE_TEST", "false").lower() == "true":
-            # Test with real hardware - verify all relays turn on
-            import time
-
-            connected_controller.all_relays_on()
-            time.sleep(0.1)
-            status = connected_controller.get_status()
-            assert all(status.values())
-        else:
-            mock_serial.readline.return_value = b"OK\r\n"
-            connected_controller.all_relays_on()
-            mock_serial.write.assert_called_with(b"ALL ON\n")
-
-    def test_all_relays_off(self, connected_controller, mock_serial):
-        """Test all_relays_off command"""
-        if os.environ.get("HARDWARE_TEST", "false").lower() == "true":
-            # Test with real hardware - verify all relays turn off
-            import time
-
-            connected_controller.all_relays_off()
-            time.sleep(0.1)
-            status = connected_controller.get_status()
-            assert all(not state for state in status.values())
-        else:
-            mock_serial.readline.return_value = b"OK\r\n"
-            connected_controller.all_relays_off()
-            mock_serial.write.assert_called_with(b"ALL OFF\n")
-
-    def test_set_relay_pattern(self, connected_controller, mock_serial):
-        """Test set_relay_pattern command"""
-        if self._is_hardware_test():
-            # Test with real hardware - verify pattern is actually set
-            import time
-
-            connected_controller.set_relay_pattern("10101010")
-            time.sleep(0.1)
-            status = connected_controller.get_status()
-            expected = [False, True, False, True, False, True, False, True]
-            actual = [status[i + 1] for i in range(8)]
-            assert actual == expected
-        else:
-            mock_serial.readline.return_value = b"OK\r\n"
-            connected_controller.set_relay_pattern("10101010")
-            mock_serial.write.assert_called_with(b"SET 10101010\n")
-
-    def test_pulse_relay(self, connected_controller, mock_serial):
-        """Test pulse_relay command"""
-        if self._is_hardware_test():
-            # Test with real hardware - just verify command executes without error
-            connected_controller.pulse_relay(1, 200)
-            # Don't test timing as it's complex in a test environment
-        else:
-            mock_serial.readline.return_value = b"OK\r\n"
-            connected_controller.pulse_relay(1, 500)
-            mock_serial.write.assert_called_with(b"PULSE 1 500\n")
-
-    def test_set_relay_name(self, connected_controller, mock_serial):
-        """Test set_relay_name command"""
-        if self._is_hardware_test():
-            # Test with real hardware
-            connected_controller.set_relay_name(1, "TEST_LIGHT")
-            # Just verify command executes without error
-        else:
-            mock_serial.readline.return_value = b"OK\r\n"
-            connected_controller.set_relay_name(1, "LIGHTS")
-            mock_serial.write.assert_called_with(b"NAME 1 LIGHTS\n")
-            
-    def test_reset_relay_name(self, connected_controller, mock_serial):
+        mock_serial.read.return_value = b"10101010\r\n"
+
+        status = connected_controller.get_status()
+
+        expected = {
+            1: False,
+            2: True,
+            3: False,
+            4: True,
+            5: False,
+            6: True,
+            7: False,
+            8: True,
+        }
+        assert status == expected
+
+    @pytest.mark.hw_only
+    @pytest.mark.parametrize("method, args", [c[:2] for c in _SIMPLE_COMMANDS])
+    def test_simple_command_hw(self, connected_controller, method, args):
+        """Test commands that expect OK execute on real hardware"""
+        getattr(connected_controller, method)(*args)
+
+    @pytest.mark.mock_only
+    @pytest.mark.parametrize("method, args, expected", _SIMPLE_COMMANDS)
+    def test_simple_command_mock(
+        self, connected_controller, mock_serial, method, args, expected
+    ):
+        """Test commands that send a fixed line and expect OK"""
+        mock_serial.read.return_value = _OK
+        getattr(connected_controller, method)(*args)
+        mock_serial.write.assert_called_with(expected)
+
+    @pytest.mark.mock_only
+    @pytest.mark.parametrize("method", ["relay_on", "relay_off"])
+    @pytest.mark.parametrize("relay_num", [0, 9, "1", True])
+    def test_relay_on_off_invalid(
+        self, connected_controller, mock_serial, method, relay_num
+    ):
+        """Test the relay_on/relay_off fast path still validates relay numbers"""
+        with pytest.raises(RelayValidationError, match="Invalid relay number"):
+            getattr(connected_controller, method)(relay_num)
+        mock_serial.write.assert_not_called()
+
+    @pytest.mark.mock_only
+    @pytest.mark.parametrize(
+        "method, args",
+        [
+            ("pulse_relay", (9, 500)),
+            ("pulse_relay", (1, 0)),
+            ("tone", (10, 500)),
+            ("tone", (1000, 6000)),
+            ("set_relay_name", (0, "LIGHTS")),
+            ("set_relay_name", (1, "X" * 33)),
+        ],
+    )
+    def test_formatted_command_invalid(
+        self, connected_controller, mock_serial, method, args
+    ):
+        """Test the bytes-formatted commands validate before writing"""
+        with pytest.raises(RelayValidationError):
+            getattr(connected_controller, method)(*args)
+        mock_serial.write.assert_not_called()
+
+    @pytest.mark.hw_only
+    @pytest.mark.parametrize(
+        "method, args, expected",
+        [
+            ("relay_on", (1,), {1: True}),
+            ("relay_off", (3,), {3: False}),
+            ("all_relays_on", (), {i: True for i in range(1, 9)}),
+            ("all_relays_off", (), {i: False for i in range(1, 9)}),
+            (
+                "set_relay_pattern",
+                ("10101010",),
+                {i + 1: bool(i % 2) for i in range(8)},
+            ),
+        ],
+    )
+    def test_relay_command_state_hw(self, connected_controller, method, args, expected):
+        """Test relay commands actually change relay state on hardware"""
+        import time
+
+        getattr(connected_controller, method)(*args)
+        time.sleep(0.1)
+        status = connected_controller.get_status()
+        for relay, state in expected.items():
+            assert status[relay] is state
+
+    @pytest.mark.mock_only
+    @pytest.mark.parametrize(
+        "response, expected",
+        [
+            (b"Commands: PING,STATUS,ON\r\n", ["PING", "STATUS", "ON"]),
+            (b"PING,STATUS\r\n", []),
+        ],
+    )
+    def test_get_help(self, connected_controller, mock_serial, response, expected):
+        """Test get_help strips the Commands: prefix and splits the list"""
+        mock_serial.read.return_value = response
+        assert connected_controller.get_help() == expected
+        mock_serial.write.assert_called_with(b"HELP\n")
+
+    @pytest.mark.hw_only
+    def test_reset_relay_name_hw(self, connected_controller):
+        """Test resetting relay name to empty string with real hardware"""
+        connected_controller.set_relay_name(1)  # Clear the name
+        name = connected_controller.get_relay_name(1)
+        assert name == ""
+
+    @pytest.mark.mock_only
+    def test_reset_relay_name_mock(self, connected_controller, mock_serial):
         """Test resetting relay name to empty string"""
-        if self._is_hardware_test():
-            # Test with real hardware
-            connected_controller.set_relay_name(1)  # Clear the name
-            name = connected_controller.get_relay_name(1)
-            assert name == ""
-        else:
-            mock_serial.readline.side_effect = [b"OK\r\n", b"\r\n"]
-            connected_controller.set_relay_name(1)  # Clear the name
-            mock_serial.write.assert_called_with(b"NAME 1\n")
-            # Verify name was cleared
-            name = connected_controller.get_relay_name(1)
-            assert name == ""
-
-    def test_get_relay_name(self, connected_controller, mock_serial):
+        mock_serial.read.side_effect = [_OK, b"\r\n"]
+        connected_controller.set_relay_name(1)  # Clear the name
+        mock_serial.write.assert_called_with(b"NAME 1\n")
+        # Verify name was cleared
+        name = connected_controller.get_relay_name(1)
+        assert name == ""
+
+    @pytest.mark.hw_only
+    def test_get_relay_name_hw(self, connected_controller):
+        """Test get_relay_name command with real hardware"""
+        name = connected_controller.get_relay_name(1)
+        assert isinstance(name, str)
+        assert len(name) > 0
+
+    @pytest.mark.mock_only
+    def test_get_relay_name_mock(self, connected_controller, mock_serial):
         """Test get_relay_name command"""
-        if self._is_hardware_test():
-            # Test with real hardware
-            name = connected_controller.get_relay_name(1)
-            assert isinstance(name, str)
-            assert len(name) > 0
-        else:
-            mock_serial.readline.return_value = b"LIGHTS\r\n"
-            name = connected_controller.get_relay_name(1)
-            assert name == "LIGHTS"
-            mock_serial.write.assert_called_with(b"GET NAME 1\n")
-
-    def test_beep_default(self, connected_controller, mock_serial):
-        """Test beep command with default duration"""
-        if self._is_hardware_test():
-            # Test with real hardware - just verify command executes
-            connected_controller.beep()
-        else:
-            mock_serial.readline.return_value = b"OK\r\n"
-            connected_controller.beep()
-            mock_serial.write.assert_called_with(b"BEEP\n")
-
-    def test_beep_with_duration(self, connected_controller, mock_serial):
-        """Test beep command with custom duration"""
-        if self._is_hardware_test():
-            # Test with real hardware - just verify command executes
-            connected_controller.beep(500)
-        else:
-            mock_serial.readline.return_value = b"OK\r\n"
-            connected_controller.beep(500)
-            mock_serial.write.assert_called_with(b"BEEP 500\n")
-
-    def test_buzzer_on(self, connected_controller, mock_serial):
-        """Test buzzer_on command"""
-        if self._is_hardware_test():
-            # Test with real hardware - just verify command executes
-            connected_controller.buzzer_on()
-        else:
-            mock_serial.readline.return_value = b"OK\r\n"
-            connected_controller.buzzer_on()
-            mock_serial.write.assert_called_with(b"BUZZ ON\n")
-
-    def test_buzzer_off(self, connected_controller, mock_serial):
-        """Test buzzer_off command"""
-        if self._is_hardware_test():
-            # Test with real hardware - just verify command executes
-            connected_controller.buzzer_off()
-        else:
-            mock_serial.readline.return_value = b"OK\r\n"
-            connected_controller.buzzer_off()
-            mock_serial.write.assert_called_with(b"BUZZ OFF\n")
-
-    def test_tone(self, connected_controller, mock_serial):
-        """Test tone command"""
-        if self._is_hardware_test():
-            # Test with real hardware - just verify command executes
-            connected_controller.tone(1000, 500)
-        else:
-            mock_serial.readline.return_value = b"OK\r\n"
-            connected_controller.tone(1000, 500)
-            mock_serial.write.assert_called_with(b"TONE 1000 500\n")
-
-    def test_get_relay_states_dict(self, connected_controller, mock_serial):
+        mock_serial.read.return_value = b"LIGHTS\r\n"
+        name = connected_controller.get_relay_name(1)
+        assert name == "LIGHTS"
+        mock_serial.write.assert_called_with(b"GET NAME 1\n")
+
+    @pytest.mark.hw_only
+    def test_get_relay_states_dict_hw(self, connected_controller):
+        """Test get_relay_states_dict command with real hardware"""
+        # Just verify structure is correct
+        result = connected_controller.get_relay_states_dict()
+        assert isinstance(result, dict)
+        assert len(result) == 8
+        for i in range(1, 9):
+            assert i in result
+            assert "name" in result[i]
+            assert "state" in result[i]
+            assert "state_str" in result[i]
+
+    @pytest.mark.mock_only
+    def test_get_relay_states_dict_mock(self, connected_controller, mock_serial):
         """Test get_relay_states_dict command"""
-        if self._is_hardware_test():
-            # Test with real hardware - just verify structure is correct
-            result = connected_controller.get_relay_states_dict()
-            assert isinstance(result, dict)
-            assert len(result) == 8
-            for i in range(1, 9):
-                assert i in result
-                assert "name" in result[i]
-                assert "state" in result[i]
-                assert "state_str" in result[i]
-        else:
-            # Mock status response
-            mock_serial.readline.side_effect = [
-                b"10101010\r\n",  # STATUS response
-                b"LIGHT1\r\n",  # GET NAME 1 response
-                b"LIGHT2\r\n",  # GET NAME 2 response
-                b"\r\n",  # GET NAME 3 response (default empty)
-                b"\r\n",  # GET NAME 4 response
-                b"\r\n",  # GET NAME 5 response
-                b"\r\n",  # GET NAME 6 response
-                b"\r\n",  # GET NAME 7 response
-                b"\r\n",  # GET NAME 8 response
-            ]
-
-            result = connected_controller.get_relay_states_dict()
-
-            expected = {
-                1: {"name": "LIGHT1", "state": False, "state_str": "OFF"},
-                2: {"name": "LIGHT2", "state": True, "state_str": "ON"},
-                3: {"name": "", "state": False, "state_str": "OFF"},
-                4: {"name": "", "state": True, "state_str": "ON"},
-                5: {"name": "", "state": False, "state_str": "OFF"},
-                6: {"name": "", "state": True, "state_str": "ON"},
-                7: {"name": "", "state": False, "state_str": "OFF"},
-                8: {"name": "", "state": True, "state_str": "ON"},
-            }
-            assert result == expected
+        # All pipelined responses arrive in one read
+        mock_serial.read.return_value = b"".join(_DICT_SIDE_EFFECT)
 
+        result = connected_controller.get_relay_states_dict()
+
+        # One write and no VERSION probe first
+        mock_serial.write.assert_called_once_with(
+            b"STATUS\n" + b"".join(b"GET NAME %d\n" % i for i in range(1, 9))
+        )
+
+        expected = {
+            1: {"name": "LIGHT1", "state": False, "state_str": "OFF"},
+            2: {"name": "LIGHT2", "state": True, "state_str": "ON"},
+            3: {"name": "", "state": False, "state_str": "OFF"},
+            4: {"name": "", "state": True, "state_str": "ON"},
+            5: {"name": "", "state": False, "state_str": "OFF"},
+            6: {"name": "", "state": True, "state_str": "ON"},
+            7: {"name": "", "state": False, "state_str": "OFF"},
+            8: {"name": "", "state": True, "state_str": "ON"},
+        }
+        assert result == expected
+
+    @pytest.mark.mock_only
     def test_get_relay_states_dict_name_error(self, connected_controller, mock_serial):
         """Test get_relay_states_dict with name retrieval error"""
-        if self._is_hardware_test():
-            # Skip error testing with real hardware
-            pytest.skip("Error condition test not applicable for hardware testing")
-        else:
-            # Mock status response and error for name
-            mock_serial.readline.side_effect = [
-                b"00000000\r\n",  # STATUS response
-                b"ERROR:INVALID_COMMAND\r\n",  # GET NAME 1 error
-                b"\r\n",  # GET NAME 2 response
-                b"\r\n",  # GET NAME 3 response
-                b"\r\n",  # GET NAME 4 response
-                b"\r\n",  # GET NAME 5 response
-                b"\r\n",  # GET NAME 6 response
-                b"\r\n",  # GET NAME 7 response
-                b"\r\n",  # GET NAME 8 response
-            ]
-
-            result = connected_controller.get_relay_states_dict()
-
-            # Should use empty string when error occurs
-            assert result[1]["name"] == ""
-            assert result[2]["name"] == ""
+        # Mock status response and error for name
+        mock_serial.read.return_value = b"".join(_DICT_ERROR_SIDE_EFFECT)
+
+        result = connected_controller.get_relay_states_dict()
+
+        # Should use empty string when error occurs
+        assert result[1]["name"] == ""
+        assert result[2]["name"] == ""
+
+    @pytest.mark.mock_only
+    def test_get_relay_states_dict_pipelined_timeout(
+        self, connected_controller, mock_serial
+    ):
+        """Test a missing pipelined response names the command it belonged to"""
+        mock_serial.read.side_effect = iter((b"00000000\r\nLIGHT1\r\n", _EMPTY))
+
+        with pytest.raises(RelayTimeoutError, match="response to GET NAME 2"):
+            connected_controller.get_relay_states_dict()
+
+
+class TestLineReader:
+    """Test cases for the chunked serial line reader"""
+
+    def test_splits_chunk_into_lines(self):
+        """Test one read carrying several responses is split line by line"""
+        port = Mock(spec=serial.Serial)
+        port.in_waiting = 11
+        port.read.side_effect = [b"OK\r\nPONG\r\n1"]
+
+        reader = _LineReader(port)
+
+        assert reader.readline() == _OK
+        assert reader.readline() == _PONG
+        port.read.assert_called_once_with(11)
+
+    def test_joins_partial_reads(self):
+        """Test a line split across reads is reassembled"""
+        port = Mock(spec=serial.Serial)
+        port.in_waiting = 0
+        port.read.side_effect = [b"PO", b"NG\r\n"]
+
+        reader = _LineReader(port)
+
+        assert reader.readline() == _PONG
+        port.read.assert_called_with(1)
+
+    def test_timeout_returns_partial_line(self):
+        """Test a timed-out read returns what was received"""
+        port = Mock(spec=serial.Serial)
+        port.in_waiting = 0
+        port.read.side_effect = [b"PO", b""]
+
+        reader = _LineReader(port)
+
+        assert reader.readline() == b"PO"
+
+    def test_read_lines_splits_once(self):
+        """Test read_lines returns count lines and keeps the remainder"""
+        port = Mock(spec=serial.Serial)
+        port.in_waiting = 0
+        port.read.side_effect = [b"10101010\r\nLIGHT1\r\n", b"\r\nPO", b"NG\r\n"]
+
+        reader = _LineReader(port)
+
+        assert reader.read_lines(3) == [b"10101010\r", b"LIGHT1\r", b"\r"]
+        assert reader.readline() == _PONG
+
+    def test_read_lines_timeout_drops_partial_line(self):
+        """Test read_lines returns only complete lines on timeout"""
+        port = Mock(spec=serial.Serial)
+        port.in_waiting = 0
+        port.read.side_effect = [b"OK\r\nPA", b""]
+
+        reader = _LineReader(port)
+
+        assert reader.read_lines(2) == [b"OK\r"]
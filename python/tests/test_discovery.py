@@ -2,45 +2,41 @@
 Tests for the USB device discovery module
 """
 
-import os
 from unittest.mock import Mock, patch
 
 import pytest
+from serial.tools.list_ports_common import ListPortInfo
+from waveshare_relay.controller import RelayController
 from waveshare_relay.discovery import (
     RelayBoardDiscovery,
     discover_relay_boards,
     find_relay_board,
 )
 
+# ListPortInfo sets its fields in __init__, so spec against an instance
+_PORT_SPEC = ListPortInfo("", skip_link_detection=True)
+
 
 class TestRelayBoardDiscovery:
     """Test cases for RelayBoardDiscovery class"""
 
-    def _is_hardware_test(self):
-        """Check if running hardware tests"""
-        return os.environ.get("HARDWARE_TEST", "false").lower() == "true"
-
+    @pytest.mark.mock_only
     @patch("waveshare_relay.discovery.serial.tools.list_ports.comports")
     def test_discover_boards_no_ports(self, mock_comports):
         """Test discovery when no serial ports are available"""
-        if self._is_hardware_test():
-            pytest.skip("Mock test not applicable for hardware testing")
-
         mock_comports.return_value = []
         boards = RelayBoardDiscovery.discover_boards()
         assert boards == []
 
+    @pytest.mark.mock_only
     @patch("waveshare_relay.discovery.serial.tools.list_ports.comports")
     @patch("waveshare_relay.controller.RelayController")
     def test_discover_boards_with_relay_board(
         self, mock_controller_class, mock_comports
     ):
         """Test discovery when a relay board is found"""
-        if self._is_hardware_test():
-            pytest.skip("Mock test not applicable for hardware testing")
-
         # Mock port info
-        mock_port = Mock()
+        mock_port = Mock(spec_set=_PORT_SPEC)
         mock_port.device = "/dev/cu.usbmodem123"
         mock_port.description = "USB Serial"
         mock_port.hwid = "USB VID:PID=2E8A:0005"
@@ -50,7 +46,7 @@ class TestRelayBoardDiscovery:
         mock_comports.return_value = [mock_port]
 
         # Mock controller
-        mock_controller = Mock()
+        mock_controller = Mock(spec_set=RelayController)
         mock_controller_class.return_value = mock_controller
         mock_controller.connect = Mock()
         mock_controller.disconnect = Mock()
@@ -72,17 +68,15 @@ class TestRelayBoardDiscovery:
         assert boards[0]["manufacturer"] == "Waveshare"
         assert boards[0]["product"] == "Pico Relay B Controller"
 
+    @pytest.mark.mock_only
     @patch("waveshare_relay.discovery.serial.tools.list_ports.comports")
     @patch("waveshare_relay.controller.RelayController")
     def test_discover_boards_non_relay_device(
         self, mock_controller_class, mock_comports
     ):
         """Test discovery when device doesn't respond to relay protocol"""
-        if self._is_hardware_test():
-            pytest.skip("Mock test not applicable for hardware testing")
-
         # Mock port info
-        mock_port = Mock()
+        mock_port = Mock(spec_set=_PORT_SPEC)
         mock_port.device = "/dev/cu.usbmodem123"
         mock_port.description = "USB Serial"
         mock_port.hwid = "USB VID:PID=1234:5678"
@@ -91,18 +85,93 @@ class TestRelayBoardDiscovery:
         mock_comports.return_value = [mock_port]
 
         # Mock controller that fails to connect
-        mock_controller = Mock()
+        mock_controller = Mock(spec_set=RelayController)
         mock_controller_class.return_value = mock_controller
         mock_controller.connect.side_effect = Exception("Connection failed")
 
-        boards = RelayBoardDiscovery.discover_boards()
+        # Full scan so the non-Pico port is still probed
+        boards = RelayBoardDiscovery.discover_boards(strict_vid=False)
         assert boards == []
+        mock_controller.connect.assert_called_once()
+        mock_controller.disconnect.assert_called_once()
 
+    @pytest.mark.mock_only
+    @patch("waveshare_relay.discovery.serial.tools.list_ports.comports")
+    @patch("waveshare_relay.controller.RelayController")
+    def test_discover_boards_closes_port_on_info_error(
+        self, mock_controller_class, mock_comports
+    ):
+        """Test a port that connects but fails get_info is still closed"""
+        mock_port = Mock(spec_set=_PORT_SPEC)
+        mock_port.device = "/dev/cu.usbmodem123"
+        mock_port.description = "USB Serial"
+        mock_port.hwid = "USB VID:PID=2E8A:0005"
+        mock_port.vid = 0x2E8A
+
+        mock_comports.return_value = [mock_port]
+
+        mock_controller = Mock(spec_set=RelayController)
+        mock_controller_class.return_value = mock_controller
+        mock_controller.get_info.side_effect = Exception("No response")
+
+        assert RelayBoardDiscovery.discover_boards() == []
+        mock_controller.disconnect.assert_called_once()
+
+    @pytest.mark.mock_only
+    @patch("waveshare_relay.discovery.serial.tools.list_ports.comports")
+    @patch("waveshare_relay.controller.RelayController")
+    def test_discover_boards_skips_other_vendors(
+        self, mock_controller_class, mock_comports
+    ):
+        """Test ports without the Raspberry Pi vendor ID are never opened"""
+        mock_port = Mock(spec_set=_PORT_SPEC)
+        mock_port.device = "/dev/cu.Bluetooth-Incoming-Port"
+        mock_port.vid = None
+
+        mock_comports.return_value = [mock_port]
+
+        assert RelayBoardDiscovery.discover_boards() == []
+        mock_controller_class.assert_not_called()
+
+    @pytest.mark.mock_only
+    @patch("waveshare_relay.discovery.serial.tools.list_ports.comports")
+    @patch("waveshare_relay.controller.RelayController")
+    def test_discover_boards_keeps_port_order(
+        self, mock_controller_class, mock_comports
+    ):
+        """Test parallel probing returns boards in port order, skipping failures"""
+        devices = ["/dev/cu.usbmodem1", "/dev/cu.usbmodem2", "/dev/cu.usbmodem3"]
+        ports = []
+        for device in devices:
+            mock_port = Mock(spec_set=_PORT_SPEC)
+            mock_port.device = device
+            mock_port.vid = 0x2E8A
+            ports.append(mock_port)
+        mock_comports.return_value = ports
+
+        def make_controller(port, **kwargs):
+            mock_controller = Mock(spec_set=RelayController)
+            if port == "/dev/cu.usbmodem2":
+                mock_controller.connect.side_effect = Exception("Connection failed")
+            mock_controller.get_info.return_value = {
+                "board_name": "WAVESHARE-PICO-RELAY-B"
+            }
+            mock_controller.get_uid.return_value = port[-1] * 16
+            return mock_controller
+
+        mock_controller_class.side_effect = make_controller
+
+        boards = RelayBoardDiscovery.discover_boards()
+
+        assert [board["port"] for board in boards] == [
+            "/dev/cu.usbmodem1",
+            "/dev/cu.usbmodem3",
+        ]
+        assert boards[1]["serial_number"] == "RELAY-33333333"
+
+    @pytest.mark.hw_only
     def test_discover_boards_hardware(self):
         """Test discovery with real hardware"""
-        if not self._is_hardware_test():
-            pytest.skip("Hardware test only runs with HARDWARE_TEST=true")
-
         boards = discover_relay_boards()
 
         # Should find at least one board when hardware is connected
@@ -120,23 +189,19 @@ class TestRelayBoardDiscovery:
         assert board["product"] == "Pico Relay B Controller"
         assert board["serial_number"].startswith("RELAY-")
 
+    @pytest.mark.hw_only
     def test_find_relay_board_hardware(self):
         """Test find_relay_board with real hardware"""
-        if not self._is_hardware_test():
-            pytest.skip("Hardware test only runs with HARDWARE_TEST=true")
-
         port = find_relay_board()
 
         # Should find a port when hardware is connected
         assert port is not None
         assert port.startswith("/dev/")
 
+    @pytest.mark.mock_only
     @patch("waveshare_relay.discovery.serial.tools.list_ports.comports")
     def test_find_relay_board_no_boards(self, mock_comports):
         """Test find_relay_board when no boards are found"""
-        if self._is_hardware_test():
-            pytest.skip("Mock test not applicable for hardware testing")
-
         mock_comports.return_value = []
         port = find_relay_board()
         assert port is None
@@ -2,6 +2,7 @@
 Tests for custom exceptions
 """
 
+import pytest
 from waveshare_relay.exceptions import (
     RelayCommandError,
     RelayConnectionError,
@@ -20,52 +21,24 @@ class TestExceptions:
         assert str(error) == "Base error message"
         assert isinstance(error, Exception)
 
-    def test_relay_connection_error(self):
-        """Test RelayConnectionError exception"""
-        error = RelayConnectionError("Connection failed")
-        assert str(error) == "Connection failed"
+    @pytest.mark.parametrize(
+        "cls, msg",
+        [
+            (RelayConnectionError, "Connection failed"),
+            (RelayTimeoutError, "Command timed out"),
+            (RelayCommandError, "Command failed"),
+            (RelayValidationError, "Invalid parameter"),
+        ],
+    )
+    def test_subclass(self, cls, msg):
+        """Test that each exception keeps its message and inherits from RelayError"""
+        error = cls(msg)
+        assert str(error) == msg
         assert isinstance(error, RelayError)
-        assert isinstance(error, Exception)
-
-    def test_relay_timeout_error(self):
-        """Test RelayTimeoutError exception"""
-        error = RelayTimeoutError("Command timed out")
-        assert str(error) == "Command timed out"
-        assert isinstance(error, RelayError)
-        assert isinstance(error, Exception)
-
-    def test_relay_command_error_without_code(self):
-        """Test RelayCommandError without error code"""
-        error = RelayCommandError("Command failed")
-        assert str(error) == "Command failed"
-        assert error.error_code is None
-        assert isinstance(error, RelayError)
-        assert isinstance(error, Exception)
 
-    def test_relay_command_error_with_code(self):
-        """Test RelayCommandError with error code"""
+    def test_relay_command_error_code(self):
+        """Test RelayCommandError with and without error code"""
+        assert RelayCommandError("Command failed").error_code is None
         error = RelayCommandError("Command failed", "INVALID_COMMAND")
         assert str(error) == "Command failed"
         assert error.error_code == "INVALID_COMMAND"
-        assert isinstance(error, RelayError)
-        assert isinstance(error, Exception)
-
-    def test_relay_validation_error(self):
-        """Test RelayValidationError exception"""
-        error = RelayValidationError("Invalid parameter")
-        assert str(error) == "Invalid parameter"
-        assert isinstance(error, RelayError)
-        assert isinstance(error, Exception)
-
-    def test_exception_hierarchy(self):
-        """Test that all exceptions inherit from RelayError"""
-        exceptions = [
-            RelayConnectionError("test"),
-            RelayTimeoutError("test"),
-            RelayCommandError("test"),
-            RelayValidationError("test"),
-        ]
-
-        for exception in exceptions:
-            assert isinstance(exception, RelayError)
-            assert isinstance(exception, Exception)
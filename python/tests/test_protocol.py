@@ -10,9 +10,8 @@ from waveshare_relay.protocol import RelayProtocol
 class TestRelayProtocol:
     """Test cases for RelayProtocol class"""
 
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.protocol = RelayProtocol()
+    # All methods are static, so the class itself serves as the protocol
+    protocol = RelayProtocol
 
     def test_validate_relay_number(self):
         """Test relay number validation"""
@@ -27,6 +26,7 @@ class TestRelayProtocol:
         assert self.protocol.validate_relay_number(-1) is False
         assert self.protocol.validate_relay_number("1") is False
         assert self.protocol.validate_relay_number(1.5) is False
+        assert self.protocol.validate_relay_number(True) is False
 
     def test_validate_binary_pattern(self):
         """Test binary pattern validation"""
@@ -162,7 +162,7 @@ class TestRelayProtocol:
         # Valid NAME commands with name
         assert self.protocol.encode_command("NAME", 1, "TEST") == "NAME 1 TEST\n"
         assert self.protocol.encode_command("name", 8, "LIGHT") == "NAME 8 LIGHT\n"
-        
+
         # Valid NAME command to clear (single parameter)
         assert self.protocol.encode_command("NAME", 1) == "NAME 1\n"
         assert self.protocol.encode_command("name", 8) == "NAME 8\n"
@@ -170,7 +170,7 @@ class TestRelayProtocol:
         # Invalid NAME commands
         with pytest.raises(RelayValidationError, match="Invalid relay number"):
             self.protocol.encode_command("NAME", 9, "TEST")
-            
+
         with pytest.raises(RelayValidationError, match="Invalid relay number"):
             self.protocol.encode_command("NAME", 9)  # Invalid relay for clear
 
@@ -283,6 +283,20 @@ class TestRelayProtocol:
         assert data is None
         assert error == "INVALID_RELAY_NUMBER"
 
+    def test_decode_response_bytes(self):
+        """Test raw bytes responses decode like their str equivalents"""
+        for raw in (
+            b"OK\r\n",
+            b"PONG\r\n",
+            b"10101010\r\n",
+            b"\r\n",
+            b"ERROR:INVALID_COMMAND\r\n",
+            b"ERROR:\r\n",
+        ):
+            assert self.protocol.decode_response_bytes(
+                raw
+            ) == self.protocol.decode_response(raw.decode())
+
     def test_parse_status_response(self):
         """Test STATUS response parsing"""
         # Valid status responses
@@ -6,6 +6,7 @@ individual relay control, bulk operations, state persistence, buzzer control,
 and device management through ASCII serial protocol communication.
 """
 
+import logging
 import time
 
 import serial
@@ -14,14 +15,112 @@ from .exceptions import (
     RelayCommandError,
     RelayConnectionError,
     RelayTimeoutError,
+    RelayValidationError,
 )
 from .protocol import RelayProtocol
 
+logger = logging.getLogger(__name__)
+
 # Configuration constants
 DEFAULT_BAUDRATE = 115200
 DEFAULT_TIMEOUT = 1.0
 CONNECTION_TIMEOUT = 5.0
 CONNECTION_POLL_DELAY = 0.1
+# Part of CONNECTION_TIMEOUT kept back from the first PING for polling retries
+CONNECTION_POLL_WINDOW = 1.0
+
+# Pre-encoded bytes for fixed commands that take no parameters
+_PRECOMPUTED = {
+    command: f"{command}{RelayProtocol.COMMAND_TERMINATOR}".encode()
+    for command in (
+        "PING",
+        "INFO",
+        "UID",
+        "STATUS",
+        "ALL ON",
+        "ALL OFF",
+        "BUZZ ON",
+        "BUZZ OFF",
+        "BEEP",
+        "VERSION",
+        "HELP",
+        "SAVE",
+        "LOAD",
+        "CLEAR",
+    )
+}
+
+# Fixed commands written directly by the bulk relay and buzzer methods
+_ALL_ON = _PRECOMPUTED["ALL ON"]
+_ALL_OFF = _PRECOMPUTED["ALL OFF"]
+_BUZZ_ON = _PRECOMPUTED["BUZZ ON"]
+_BUZZ_OFF = _PRECOMPUTED["BUZZ OFF"]
+
+# Byte templates for the per-relay fast paths
+_ON_TMPL = b"ON %d\n"
+_OFF_TMPL = b"OFF %d\n"
+_PULSE_FMT = b"PULSE %d %d\n"
+_TONE_FMT = b"TONE %d %d\n"
+_NAME_FMT = b"NAME %d %s\n"
+
+# STATUS plus GET NAME 1..8, written in one go when pipelining
+_STATES_COMMANDS = ("STATUS",) + tuple(
+    f"GET NAME {relay_num}" for relay_num in range(1, 9)
+)
+_STATES_QUERY = b"".join(
+    f"{command}{RelayProtocol.COMMAND_TERMINATOR}".encode()
+    for command in _STATES_COMMANDS
+)
+
+
+class _LineReader:
+    """
+    Read response lines from a serial port a chunk at a time.
+
+    pyserial's readline() fetches one byte per read() call. This reads
+    whatever the port already has buffered (at least one byte, subject to
+    the port timeout) and keeps bytes past the newline for the next call.
+    """
+
+    def __init__(self, port: serial.Serial):
+        self._port = port
+        self._buffer = bytearray()
+
+    def readline(self) -> bytes:
+        """Return the next line with its newline, or a partial line on timeout"""
+        buffer = self._buffer
+        while True:
+            end = buffer.find(b"\n") + 1
+            if end:
+                line = bytes(buffer[:end])
+                del buffer[:end]
+                return line
+            chunk = self._port.read(self._port.in_waiting or 1)
+            if not chunk:
+                line = bytes(buffer)
+                buffer.clear()
+                return line
+            buffer += chunk
+
+    def read_lines(self, count: int) -> list[bytes]:
+        """
+        Return the next count lines without their newlines
+
+        Reads until the buffer holds count newlines and splits it once.
+        Returns fewer lines, dropping any partial one, on timeout.
+        """
+        buffer = self._buffer
+        while buffer.count(b"\n") < count:
+            chunk = self._port.read(self._port.in_waiting or 1)
+            if not chunk:
+                break
+            buffer += chunk
+
+        *lines, rest = buffer.split(b"\n", count)
+        if len(lines) < count:
+            rest = b""
+        buffer[:] = rest
+        return [bytes(line) for line in lines]
 
 
 class RelayController:
@@ -43,11 +142,16 @@ class RelayController:
     - Context manager support for automatic cleanup
     """
 
+    # RelayProtocol is stateless; kept as an attribute for existing callers
+    protocol = RelayProtocol
+
     def __init__(
         self,
         port: str,
         baudrate: int = DEFAULT_BAUDRATE,
         timeout: float = DEFAULT_TIMEOUT,
+        flush: bool = False,
+        low_latency: bool = False,
     ):
         """
         Initialize relay controller
@@ -56,12 +160,19 @@ class RelayController:
             port: Serial port path (e.g., '/dev/cu.usbmodem84401')
             baudrate: Serial communication baud rate (default: 115200)
             timeout: Command timeout in seconds (default: 1.0)
+            flush: Drain the output buffer after every command write
+                (default: False). The response read already waits for the
+                command to go out, and disconnect() drains on close.
+            low_latency: Ask the serial driver for low-latency mode on connect
+                (default: False). Ignored where pyserial does not support it.
         """
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
+        self.flush = flush
+        self.low_latency = low_latency
         self.serial = None
-        self.protocol = RelayProtocol()
+        self._reader = None
         self.connected = False
 
     def connect(self) -> None:
@@ -76,17 +187,34 @@ class RelayController:
                 port=self.port, baudrate=self.baudrate, timeout=self.timeout
             )
 
+            if self.low_latency:
+                # Linux only (ASYNC_LOW_LATENCY); other platforms lack the method
+                try:
+                    self.serial.set_low_latency_mode(True)
+                except (AttributeError, OSError, ValueError) as e:
+                    logger.debug(f"Low latency mode unavailable on {self.port}: {e}")
+
+            self._reader = _LineReader(self.serial)
+
             # Set connected temporarily for ping test
             self.connected = True
 
-            # Poll for connection readiness with timeout
-            start_time = time.time()
-
-            while time.time() - start_time < CONNECTION_TIMEOUT:
+            # One blocking PING covers the normal case; the rest of the
+            # connection timeout is kept for short polling, so boards that
+            # drop the first message still get retried
+            self.serial.timeout = CONNECTION_TIMEOUT - CONNECTION_POLL_WINDOW
+            try:
                 if self.ping():
                     return  # Connection successful
+            finally:
+                self.serial.timeout = self.timeout
+
+            start_time = time.time()
+            while time.time() - start_time < CONNECTION_POLL_WINDOW:
                 # Small delay between polling attempts
                 time.sleep(CONNECTION_POLL_DELAY)
+                if self.ping():
+                    return  # Connection successful
 
             # If we get here, connection failed
             self.connected = False
@@ -115,7 +243,7 @@ class RelayController:
         Send a command to the relay board and return response
 
         Args:
-            command: Command name
+            command: Uppercase command name
             *args: Command parameters
 
         Returns:
@@ -130,26 +258,41 @@ class RelayController:
         if not self.connected or not self.serial:
             raise RelayConnectionError("Not connected to relay board")
 
-        # Encode command
-        cmd_string = self.protocol.encode_command(command, *args)
+        # Encode command, skipping the encoder for fixed commands
+        cmd_bytes = None if args else _PRECOMPUTED.get(command)
+        if cmd_bytes is None:
+            cmd_bytes = RelayProtocol._encode(command, args).encode("utf-8")
+
+        return self._raw_write_read(cmd_bytes, command)
+
+    def _raw_write_read(self, cmd_bytes: bytes, command: str) -> str:
+        """
+        Write an already encoded command and return the decoded response
+
+        Args:
+            cmd_bytes: Complete command line including terminator
+            command: Command name used in error messages
+
+        Returns:
+            Response data string
+        """
+        if not self.connected or not self.serial:
+            raise RelayConnectionError("Not connected to relay board")
 
         # Send command
         try:
-            self.serial.write(cmd_string.encode("utf-8"))
-            self.serial.flush()
+            self.serial.write(cmd_bytes)
+            if self.flush:
+                self.serial.flush()
 
             # Read response
-            response_bytes = self.serial.readline()
-            if not response_bytes:
-                raise RelayTimeoutError(f"Timeout waiting for response to {command}")
-
-            response = response_bytes.decode("utf-8").strip()
+            response = self._read_response(command)
 
         except serial.SerialException as e:
             raise RelayConnectionError(f"Serial communication error: {e}") from e
 
         # Decode response
-        is_success, data, error_code = self.protocol.decode_response(response)
+        is_success, data, error_code = RelayProtocol.decode_response_bytes(response)
 
         if not is_success:
             raise RelayCommandError(
@@ -158,6 +301,22 @@ class RelayController:
 
         return data
 
+    def _read_response(self, command: str) -> bytes:
+        """Read one raw response line, raising RelayTimeoutError if none arrives"""
+        response_bytes = self._reader.readline()
+        if not response_bytes:
+            raise RelayTimeoutError(f"Timeout waiting for response to {command}")
+        return response_bytes
+
+    def _read_n_responses(self, commands: tuple[str, ...]) -> list[bytes]:
+        """Read one raw response per pipelined command, in order"""
+        responses = self._reader.read_lines(len(commands))
+        if len(responses) < len(commands):
+            raise RelayTimeoutError(
+                f"Timeout waiting for response to {commands[len(responses)]}"
+            )
+        return responses
+
     def ping(self) -> bool:
         """
         Test connection to relay board
@@ -179,7 +338,7 @@ class RelayController:
             Dictionary with board information
         """
         response = self._send_command("INFO")
-        return self.protocol.parse_info_response(response)
+        return RelayProtocol.parse_info_response(response)
 
     def get_uid(self) -> str:
         """
@@ -198,7 +357,7 @@ class RelayController:
             Dictionary mapping relay numbers (1-8) to boolean states
         """
         response = self._send_command("STATUS")
-        return self.protocol.parse_status_response(response)
+        return RelayProtocol.parse_status_response(response)
 
     def relay_on(self, relay_num: int) -> None:
         """
@@ -207,7 +366,7 @@ class RelayController:
         Args:
             relay_num: Relay number (1-8)
         """
-        self._send_command("ON", relay_num)
+        self.fast_on(relay_num)
 
     def relay_off(self, relay_num: int) -> None:
         """
@@ -216,15 +375,39 @@ class RelayController:
         Args:
             relay_num: Relay number (1-8)
         """
-        self._send_command("OFF", relay_num)
+        self.fast_off(relay_num)
+
+    def fast_on(self, relay_num: int) -> None:
+        """
+        Turn on a relay, formatting the command bytes directly
+
+        Skips the generic encode_command dispatch; validation is the same.
+
+        Args:
+            relay_num: Relay number (1-8)
+        """
+        if not RelayProtocol.validate_relay_number(relay_num):
+            raise RelayValidationError(f"Invalid relay number: {relay_num}")
+        self._raw_write_read(_ON_TMPL % relay_num, "ON")
+
+    def fast_off(self, relay_num: int) -> None:
+        """
+        Turn off a relay, formatting the command bytes directly
+
+        Args:
+            relay_num: Relay number (1-8)
+        """
+        if not RelayProtocol.validate_relay_number(relay_num):
+            raise RelayValidationError(f"Invalid relay number: {relay_num}")
+        self._raw_write_read(_OFF_TMPL % relay_num, "OFF")
 
     def all_relays_on(self) -> None:
         """Turn all relays on"""
-        self._send_command("ALL", "ON")
+        self._raw_write_read(_ALL_ON, "ALL ON")
 
     def all_relays_off(self) -> None:
         """Turn all relays off"""
-        self._send_command("ALL", "OFF")
+        self._raw_write_read(_ALL_OFF, "ALL OFF")
 
     def set_relay_pattern(self, pattern: str) -> None:
         """
@@ -243,7 +426,8 @@ class RelayController:
             relay_num: Relay number (1-8)
             duration_ms: Duration in milliseconds (1-5000)
         """
-        self._send_command("PULSE", relay_num, duration_ms)
+        RelayProtocol._check_pulse(relay_num, duration_ms)
+        self._raw_write_read(_PULSE_FMT % (relay_num, duration_ms), "PULSE")
 
     def set_relay_name(self, relay_num: int, name: str | None = None) -> None:
         """
@@ -256,7 +440,10 @@ class RelayController:
         if name is None:
             self._send_command("NAME", relay_num)
         else:
-            self._send_command("NAME", relay_num, name)
+            if not RelayProtocol.validate_relay_number(relay_num):
+                raise RelayValidationError(f"Invalid relay number: {relay_num}")
+            RelayProtocol._check_name(name)
+            self._raw_write_read(_NAME_FMT % (relay_num, name.encode("utf-8")), "NAME")
 
     def get_relay_name(self, relay_num: int) -> str:
         """
@@ -284,11 +471,11 @@ class RelayController:
 
     def buzzer_on(self) -> None:
         """Turn buzzer on continuously"""
-        self._send_command("BUZZ", "ON")
+        self._raw_write_read(_BUZZ_ON, "BUZZ ON")
 
     def buzzer_off(self) -> None:
         """Turn buzzer off"""
-        self._send_command("BUZZ", "OFF")
+        self._raw_write_read(_BUZZ_OFF, "BUZZ OFF")
 
     def tone(self, frequency: int, duration_ms: int) -> None:
         """
@@ -298,31 +485,59 @@ class RelayController:
             frequency: Frequency in Hz (50-20000)
             duration_ms: Duration in milliseconds (1-5000)
         """
-        self._send_command("TONE", frequency, duration_ms)
+        RelayProtocol._check_tone(frequency, duration_ms)
+        self._raw_write_read(_TONE_FMT % (frequency, duration_ms), "TONE")
 
     def get_relay_states_dict(self) -> dict[int, dict[str, bool | str]]:
         """
         Get comprehensive relay information including names and states
 
+        STATUS and all eight GET NAME commands are written at once and the
+        nine responses read back in order, saving eight serial round-trips.
+        Every released firmware reads commands line by line from a buffered
+        stream and answers them in order, so no version check is needed.
+
         Returns:
             Dictionary with relay info including names and states
         """
-        states = self.get_status()
-        result = {}
-
-        for relay_num in range(1, 9):
-            try:
-                name = self.get_relay_name(relay_num)
-            except Exception:
-                name = ""
+        states, names = self._query_states_pipelined()
 
-            result[relay_num] = {
+        return {
+            relay_num: {
                 "name": name,
                 "state": states[relay_num],
                 "state_str": "ON" if states[relay_num] else "OFF",
             }
+            for relay_num, name in zip(range(1, 9), names, strict=True)
+        }
+
+    def _query_states_pipelined(self) -> tuple[dict[int, bool], list[str]]:
+        """Send STATUS and GET NAME 1..8 together and read all nine responses"""
+        if not self.connected or not self.serial:
+            raise RelayConnectionError("Not connected to relay board")
+
+        try:
+            self.serial.write(_STATES_QUERY)
+            if self.flush:
+                self.serial.flush()
+            status_response, *name_responses = self._read_n_responses(_STATES_COMMANDS)
+        except serial.SerialException as e:
+            raise RelayConnectionError(f"Serial communication error: {e}") from e
+
+        # All responses are read first so the stream stays in sync on errors
+        is_success, data, error_code = RelayProtocol.decode_response_bytes(
+            status_response
+        )
+        if not is_success:
+            raise RelayCommandError(f"Command STATUS failed: {error_code}", error_code)
+        states = RelayProtocol.parse_status_response(data)
+
+        names = []
+        for response in name_responses:
+            is_success, data, _ = RelayProtocol.decode_response_bytes(response)
+            names.append(data if is_success else "")
 
-        return result
+        return states, names
 
     def get_version(self) -> str:
         """
@@ -342,10 +557,8 @@ class RelayController:
         """
         response = self._send_command("HELP")
         # Response format: "Commands: PING,STATUS,ON,OFF,..."
-        if response.startswith("Commands: "):
-            command_str = response[10:]  # Remove "Commands: " prefix
-            return command_str.split(",")
-        return []
+        head, sep, command_str = response.partition("Commands: ")
+        return command_str.split(",") if sep and not head else []
 
     def save_state(self) -> None:
         """
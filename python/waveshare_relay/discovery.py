@@ -7,6 +7,7 @@ to PING commands, making it more reliable than USB descriptor matching.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import serial.tools.list_ports
 
@@ -14,6 +15,7 @@ logger = logging.getLogger(__name__)
 
 # Configuration constants
 DISCOVERY_TIMEOUT = 2.0
+MAX_PROBE_WORKERS = 16
 
 
 class RelayBoardDiscovery:
@@ -28,10 +30,15 @@ class RelayBoardDiscovery:
     EXPECTED_PRODUCT_ID = "0005"  # MicroPython board
 
     @classmethod
-    def discover_boards(cls) -> list[dict[str, str]]:
+    def discover_boards(cls, strict_vid: bool = True) -> list[dict[str, str]]:
         """
         Discover all connected Waveshare Pico Relay B Controller boards
 
+        Args:
+            strict_vid: Only probe ports reporting the Raspberry Pi USB vendor
+                ID (default: True). Pass False to probe every serial port,
+                e.g. behind an adapter that does not report USB IDs.
+
         Returns:
             List of board info dictionaries with keys:
             - port: serial port path
@@ -43,25 +50,28 @@ class RelayBoardDiscovery:
 
         # Use protocol-based discovery (most reliable method)
         try:
-            boards.extend(cls._discover_boards())
+            boards.extend(cls._discover_boards(strict_vid))
         except Exception as e:
             logger.debug(f"Discovery failed: {e}")
 
         return boards
 
     @classmethod
-    def find_first_board(cls) -> str | None:
+    def find_first_board(cls, strict_vid: bool = True) -> str | None:
         """
         Find the first available Waveshare Pico Relay B Controller
 
+        Args:
+            strict_vid: Only probe ports with the Raspberry Pi vendor ID
+
         Returns:
             Serial port path or None if no board found
         """
-        boards = cls.discover_boards()
+        boards = cls.discover_boards(strict_vid)
         return boards[0]["port"] if boards else None
 
     @classmethod
-    def _discover_boards(cls) -> list[dict[str, str]]:
+    def _discover_boards(cls, strict_vid: bool = True) -> list[dict[str, str]]:
         """Discover boards by scanning serial ports and testing protocol"""
         boards = []
 
@@ -69,70 +79,85 @@ class RelayBoardDiscovery:
             # Get all available serial ports (cross-platform)
             ports = serial.tools.list_ports.comports()
 
-            for port_info in ports:
-                port = port_info.device
-                logger.debug(
-                    f"Checking port: {port} - {port_info.description} [{port_info.hwid}]"
+            # Skip opening ports that cannot be a Pico; each one would
+            # otherwise cost a full connect and PING timeout
+            if strict_vid:
+                vendor_id = int(cls.EXPECTED_VENDOR_ID, 16)
+                ports = [port_info for port_info in ports if port_info.vid == vendor_id]
+            if not ports:
+                return boards
+
+            # Probing is almost all time spent blocked in serial reads, so
+            # ports are probed in parallel; map() keeps the port order
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_PROBE_WORKERS, len(ports))
+            ) as executor:
+                boards.extend(
+                    board for board in executor.map(cls._probe_port, ports) if board
                 )
 
-                # Quick filter: Check if this might be a Pico board
-                if port_info.vid == 0x2E8A:  # Raspberry Pi Foundation
-                    logger.debug(f"Found Raspberry Pi device at {port}")
-
-                try:
-                    # Try to connect and identify the device
-                    from .controller import RelayController
-
-                    controller = RelayController(port, timeout=DISCOVERY_TIMEOUT)
-                    controller.connect()
-
-                    # Try to get device info
-                    try:
-                        info = controller.get_info()
-                        uid = controller.get_uid()
-
-                        # Check if this looks like our board
-                        board_name = info.get("board_name", "").upper()
-                        if "PICO" in board_name and "RELAY" in board_name:
-                            boards.append(
-                                {
-                                    "port": port,
-                                    "serial_number": f"RELAY-{uid[:8]}",
-                                    "manufacturer": "Waveshare",
-                                    "product": "Pico Relay B Controller",
-                                }
-                            )
-                    except Exception:
-                        # Device doesn't respond to our protocol
-                        pass
-
-                    controller.disconnect()
-
-                except Exception:
-                    # Failed to connect or communicate
-                    continue
-
         except Exception as e:
             logger.debug(f"Port scan error: {e}")
 
         return boards
 
+    @classmethod
+    def _probe_port(cls, port_info) -> dict[str, str] | None:
+        """Connect to one serial port and return board info if it is a relay board"""
+        from .controller import RelayController
+
+        port = port_info.device
+        logger.debug(
+            f"Checking port: {port} - {port_info.description} [{port_info.hwid}]"
+        )
 
-def discover_relay_boards() -> list[dict[str, str]]:
+        # Try to connect and identify the device
+        controller = RelayController(port, timeout=DISCOVERY_TIMEOUT, low_latency=True)
+        try:
+            try:
+                controller.connect()
+                info = controller.get_info()
+                uid = controller.get_uid()
+            finally:
+                # Close the port on every path; probes run in parallel
+                controller.disconnect()
+        except Exception:
+            # Failed to connect, or device doesn't respond to our protocol
+            return None
+
+        # Check if this looks like our board
+        board_name = info.get("board_name", "").upper()
+        if "PICO" in board_name and "RELAY" in board_name:
+            return {
+                "port": port,
+                "serial_number": f"RELAY-{uid[:8]}",
+                "manufacturer": "Waveshare",
+                "product": "Pico Relay B Controller",
+            }
+        return None
+
+
+def discover_relay_boards(strict_vid: bool = True) -> list[dict[str, str]]:
     """
     Convenience function to discover all Waveshare Pico Relay B Controller boards
 
+    Args:
+        strict_vid: Only probe ports with the Raspberry Pi vendor ID
+
     Returns:
         List of board info dictionaries
     """
-    return RelayBoardDiscovery.discover_boards()
+    return RelayBoardDiscovery.discover_boards(strict_vid)
 
 
-def find_relay_board() -> str | None:
+def find_relay_board(strict_vid: bool = True) -> str | None:
     """
     Convenience function to find the first available Waveshare Pico Relay B Controller
 
+    Args:
+        strict_vid: Only probe ports with the Raspberry Pi vendor ID
+
     Returns:
         Serial port path or None if no board found
     """
-    return RelayBoardDiscovery.find_first_board()
+    return RelayBoardDiscovery.find_first_board(strict_vid)
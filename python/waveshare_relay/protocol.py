@@ -6,6 +6,54 @@ import re
 
 from .exceptions import RelayValidationError
 
+# Encoder factories for RelayProtocol._ENCODERS. Each pre-renders every valid
+# command line so the encoder it returns is a lookup.
+
+
+def _no_args(name: str, terminator: str):
+    """Build an encoder for a command that takes no parameters"""
+    line = f"{name}{terminator}"
+
+    def encode(*args):
+        if args:
+            raise RelayValidationError(f"{name} command takes no parameters")
+        return line
+
+    return encode
+
+
+def _relay_arg(name: str, terminator: str, relays):
+    """Build an encoder for a command taking a single relay number"""
+    lines = {relay_num: f"{name} {relay_num}{terminator}" for relay_num in relays}
+
+    def encode(*args):
+        if len(args) != 1:
+            raise RelayValidationError(f"{name} command requires exactly one parameter")
+        relay_num = args[0]
+        # type() check keeps bools out, since True == 1 as a dict key
+        if type(relay_num) is not int or relay_num not in lines:
+            raise RelayValidationError(f"Invalid relay number: {relay_num}")
+        return lines[relay_num]
+
+    return encode
+
+
+def _on_off_arg(name: str, terminator: str, operations):
+    """Build an encoder for a command taking ON or OFF"""
+    lines = {operation: f"{name} {operation}{terminator}" for operation in operations}
+
+    def encode(*args):
+        if len(args) != 1:
+            raise RelayValidationError(f"{name} command requires exactly one parameter")
+        operation = str(args[0]).upper()
+        if operation not in lines:
+            raise RelayValidationError(
+                f"{name} command parameter must be ON or OFF, got: {operation}"
+            )
+        return lines[operation]
+
+    return encode
+
 
 class RelayProtocol:
     """
@@ -23,6 +71,7 @@ class RelayProtocol:
     # Valid relay numbers
     MIN_RELAY = 1
     MAX_RELAY = 8
+    _VALID_RELAY_NUMS = frozenset(range(MIN_RELAY, MAX_RELAY + 1))
 
     # Command parameter validation
     BEEP_MIN_DURATION = 1
@@ -38,25 +87,31 @@ class RelayProtocol:
     # Error code patterns
     ERROR_PATTERN = re.compile(r"^ERROR:(.+)$")
 
-    def __init__(self):
-        """Initialize protocol encoder/decoder"""
-        pass
+    # Exactly eight binary digits (SET patterns and STATUS responses)
+    _BIN8_RE = re.compile(r"\A[01]{8}\Z")
 
-    def validate_relay_number(self, relay_num: int) -> bool:
+    # Accepted ALL/BUZZ parameters and GET subcommands
+    _ON_OFF = frozenset(("ON", "OFF"))
+    _GET_SUBCMDS = frozenset(("NAME",))
+
+    # INFO response fields, in order
+    _INFO_KEYS = ("board_name", "version", "channels", "uid")
+
+    @staticmethod
+    def validate_relay_number(relay_num: int) -> bool:
         """Validate relay number is in valid range (1-8)"""
-        return (
-            isinstance(relay_num, int) and self.MIN_RELAY <= relay_num <= self.MAX_RELAY
-        )
+        return type(relay_num) is int and relay_num in RelayProtocol._VALID_RELAY_NUMS
 
-    def validate_binary_pattern(self, pattern: str) -> bool:
+    @staticmethod
+    def validate_binary_pattern(pattern: str) -> bool:
         """Validate 8-bit binary pattern"""
         return (
             isinstance(pattern, str)
-            and len(pattern) == 8
-            and all(c in "01" for c in pattern)
+            and RelayProtocol._BIN8_RE.match(pattern) is not None
         )
 
-    def encode_command(self, command: str, *args) -> str:
+    @staticmethod
+    def encode_command(command: str, *args) -> str:
         """
         Encode a command with parameters into protocol format
 
@@ -70,194 +125,160 @@ class RelayProtocol:
         Raises:
             RelayValidationError: If command or parameters are invalid
         """
-        command = command.upper()
-
-        # Validate and format based on command type
-        if command == "PING":
-            if args:
-                raise RelayValidationError("PING command takes no parameters")
-            return f"PING{self.COMMAND_TERMINATOR}"
-
-        elif command == "ON":
-            if len(args) != 1:
-                raise RelayValidationError("ON command requires exactly one parameter")
-            relay_num = args[0]
-            if not self.validate_relay_number(relay_num):
-                raise RelayValidationError(f"Invalid relay number: {relay_num}")
-            return f"ON {relay_num}{self.COMMAND_TERMINATOR}"
-
-        elif command == "OFF":
-            if len(args) != 1:
-                raise RelayValidationError("OFF command requires exactly one parameter")
-            relay_num = args[0]
-            if not self.validate_relay_number(relay_num):
-                raise RelayValidationError(f"Invalid relay number: {relay_num}")
-            return f"OFF {relay_num}{self.COMMAND_TERMINATOR}"
-
-        elif command == "STATUS":
-            if args:
-                raise RelayValidationError("STATUS command takes no parameters")
-            return f"STATUS{self.COMMAND_TERMINATOR}"
-
-        elif command == "ALL":
-            if len(args) != 1:
-                raise RelayValidationError("ALL command requires exactly one parameter")
-            operation = str(args[0]).upper()
-            if operation not in ["ON", "OFF"]:
-                raise RelayValidationError(
-                    f"ALL command parameter must be ON or OFF, got: {operation}"
-                )
-            return f"ALL {operation}{self.COMMAND_TERMINATOR}"
-
-        elif command == "SET":
-            if len(args) != 1:
-                raise RelayValidationError("SET command requires exactly one parameter")
-            pattern = str(args[0])
-            if not self.validate_binary_pattern(pattern):
-                raise RelayValidationError(f"Invalid binary pattern: {pattern}")
-            return f"SET {pattern}{self.COMMAND_TERMINATOR}"
-
-        elif command == "PULSE":
-            if len(args) != 2:
-                raise RelayValidationError(
-                    "PULSE command requires exactly two parameters"
-                )
-            relay_num, duration_ms = args
-            if not self.validate_relay_number(relay_num):
-                raise RelayValidationError(f"Invalid relay number: {relay_num}")
-            if not isinstance(duration_ms, int) or not (
-                self.PULSE_MIN_DURATION <= duration_ms <= self.PULSE_MAX_DURATION
-            ):
-                raise RelayValidationError(
-                    f"Invalid duration: {duration_ms} (must be {self.PULSE_MIN_DURATION}-{self.PULSE_MAX_DURATION}ms)"
-                )
-            return f"PULSE {relay_num} {duration_ms}{self.COMMAND_TERMINATOR}"
-
-        elif command == "INFO":
-            if args:
-                raise RelayValidationError("INFO command takes no parameters")
-            return f"INFO{self.COMMAND_TERMINATOR}"
-
-        elif command == "UID":
-            if args:
-                raise RelayValidationError("UID command takes no parameters")
-            return f"UID{self.COMMAND_TERMINATOR}"
-
-        elif command == "NAME":
-            if len(args) not in [1, 2]:
-                raise RelayValidationError(
-                    "NAME command requires 1 or 2 parameters"
-                )
-            relay_num = args[0]
-            if not self.validate_relay_number(relay_num):
-                raise RelayValidationError(f"Invalid relay number: {relay_num}")
-            
-            if len(args) == 1:
-                # Clear name - just relay number
-                return f"NAME {relay_num}{self.COMMAND_TERMINATOR}"
-            else:
-                # Set name
-                name = args[1]
-                if (
-                    not isinstance(name, str)
-                    or len(name) == 0
-                    or len(name) > self.NAME_MAX_LENGTH
-                ):
-                    raise RelayValidationError(
-                        f"Invalid name: {name} (must be 1-{self.NAME_MAX_LENGTH} characters)"
-                    )
-                return f"NAME {relay_num} {name}{self.COMMAND_TERMINATOR}"
-
-        elif command == "GET":
-            if len(args) != 2:
-                raise RelayValidationError(
-                    "GET command requires exactly two parameters"
-                )
-            subcommand, relay_num = args
-            if str(subcommand).upper() != "NAME":
-                raise RelayValidationError(
-                    f"GET subcommand must be NAME, got: {subcommand}"
-                )
-            if not self.validate_relay_number(relay_num):
-                raise RelayValidationError(f"Invalid relay number: {relay_num}")
-            return f"GET NAME {relay_num}{self.COMMAND_TERMINATOR}"
-
-        elif command == "BEEP":
-            if len(args) == 0:
-                return f"BEEP{self.COMMAND_TERMINATOR}"
-            elif len(args) == 1:
-                duration_ms = args[0]
-                if not isinstance(duration_ms, int) or not (
-                    self.BEEP_MIN_DURATION <= duration_ms <= self.BEEP_MAX_DURATION
-                ):
-                    raise RelayValidationError(
-                        f"Invalid beep duration: {duration_ms} (must be {self.BEEP_MIN_DURATION}-{self.BEEP_MAX_DURATION}ms)"
-                    )
-                return f"BEEP {duration_ms}{self.COMMAND_TERMINATOR}"
-            else:
-                raise RelayValidationError("BEEP command takes 0 or 1 parameters")
-
-        elif command == "BUZZ":
-            if len(args) != 1:
-                raise RelayValidationError(
-                    "BUZZ command requires exactly one parameter"
-                )
-            operation = str(args[0]).upper()
-            if operation not in ["ON", "OFF"]:
-                raise RelayValidationError(
-                    f"BUZZ command parameter must be ON or OFF, got: {operation}"
-                )
-            return f"BUZZ {operation}{self.COMMAND_TERMINATOR}"
-
-        elif command == "TONE":
-            if len(args) != 2:
-                raise RelayValidationError(
-                    "TONE command requires exactly two parameters"
-                )
-            frequency, duration_ms = args
-            if not isinstance(frequency, int) or not (
-                self.TONE_MIN_FREQUENCY <= frequency <= self.TONE_MAX_FREQUENCY
-            ):
-                raise RelayValidationError(
-                    f"Invalid frequency: {frequency} (must be {self.TONE_MIN_FREQUENCY}-{self.TONE_MAX_FREQUENCY}Hz)"
-                )
-            if not isinstance(duration_ms, int) or not (
-                self.TONE_MIN_DURATION <= duration_ms <= self.TONE_MAX_DURATION
-            ):
-                raise RelayValidationError(
-                    f"Invalid duration: {duration_ms} (must be {self.TONE_MIN_DURATION}-{self.TONE_MAX_DURATION}ms)"
-                )
-            return f"TONE {frequency} {duration_ms}{self.COMMAND_TERMINATOR}"
-
-        elif command == "VERSION":
-            if args:
-                raise RelayValidationError("VERSION command takes no parameters")
-            return f"VERSION{self.COMMAND_TERMINATOR}"
-
-        elif command == "HELP":
-            if args:
-                raise RelayValidationError("HELP command takes no parameters")
-            return f"HELP{self.COMMAND_TERMINATOR}"
-
-        elif command == "SAVE":
-            if args:
-                raise RelayValidationError("SAVE command takes no parameters")
-            return f"SAVE{self.COMMAND_TERMINATOR}"
-
-        elif command == "LOAD":
-            if args:
-                raise RelayValidationError("LOAD command takes no parameters")
-            return f"LOAD{self.COMMAND_TERMINATOR}"
-
-        elif command == "CLEAR":
-            if args:
-                raise RelayValidationError("CLEAR command takes no parameters")
-            return f"CLEAR{self.COMMAND_TERMINATOR}"
-
-        else:
-            raise RelayValidationError(f"Unknown command: {command}")
-
-    def decode_response(self, response: str) -> tuple[bool, str | None, str | None]:
+        return RelayProtocol._encode(command.upper(), args)
+
+    @staticmethod
+    def _encode(command: str, args: tuple) -> str:
+        """encode_command for callers that already pass an uppercase name"""
+        try:
+            encoder = RelayProtocol._ENCODERS[command]
+        except KeyError:
+            raise RelayValidationError(f"Unknown command: {command}") from None
+        return encoder(*args)
+
+    @staticmethod
+    def _encode_set(*args) -> str:
+        if len(args) != 1:
+            raise RelayValidationError("SET command requires exactly one parameter")
+        pattern = str(args[0])
+        if not RelayProtocol.validate_binary_pattern(pattern):
+            raise RelayValidationError(f"Invalid binary pattern: {pattern}")
+        return f"SET {pattern}{RelayProtocol.COMMAND_TERMINATOR}"
+
+    @staticmethod
+    def _check_pulse(relay_num, duration_ms) -> None:
+        """Raise RelayValidationError unless the PULSE parameters are valid"""
+        if not RelayProtocol.validate_relay_number(relay_num):
+            raise RelayValidationError(f"Invalid relay number: {relay_num}")
+        if not isinstance(duration_ms, int) or not (
+            RelayProtocol.PULSE_MIN_DURATION
+            <= duration_ms
+            <= RelayProtocol.PULSE_MAX_DURATION
+        ):
+            raise RelayValidationError(
+                f"Invalid duration: {duration_ms} (must be {RelayProtocol.PULSE_MIN_DURATION}-{RelayProtocol.PULSE_MAX_DURATION}ms)"
+            )
+
+    @staticmethod
+    def _encode_pulse(*args) -> str:
+        if len(args) != 2:
+            raise RelayValidationError("PULSE command requires exactly two parameters")
+        relay_num, duration_ms = args
+        RelayProtocol._check_pulse(relay_num, duration_ms)
+        return f"PULSE {relay_num} {duration_ms}{RelayProtocol.COMMAND_TERMINATOR}"
+
+    @staticmethod
+    def _encode_name(*args) -> str:
+        if len(args) not in [1, 2]:
+            raise RelayValidationError("NAME command requires 1 or 2 parameters")
+        relay_num = args[0]
+        if not RelayProtocol.validate_relay_number(relay_num):
+            raise RelayValidationError(f"Invalid relay number: {relay_num}")
+
+        if len(args) == 1:
+            # Clear name - just relay number
+            return f"NAME {relay_num}{RelayProtocol.COMMAND_TERMINATOR}"
+
+        # Set name
+        name = args[1]
+        RelayProtocol._check_name(name)
+        return f"NAME {relay_num} {name}{RelayProtocol.COMMAND_TERMINATOR}"
+
+    @staticmethod
+    def _check_name(name) -> None:
+        """Raise RelayValidationError unless name is a valid relay name"""
+        if (
+            not isinstance(name, str)
+            or len(name) == 0
+            or len(name) > RelayProtocol.NAME_MAX_LENGTH
+        ):
+            raise RelayValidationError(
+                f"Invalid name: {name} (must be 1-{RelayProtocol.NAME_MAX_LENGTH} characters)"
+            )
+
+    @staticmethod
+    def _encode_get(*args) -> str:
+        if len(args) != 2:
+            raise RelayValidationError("GET command requires exactly two parameters")
+        subcommand, relay_num = args
+        if str(subcommand).upper() not in RelayProtocol._GET_SUBCMDS:
+            raise RelayValidationError(
+                f"GET subcommand must be NAME, got: {subcommand}"
+            )
+        if not RelayProtocol.validate_relay_number(relay_num):
+            raise RelayValidationError(f"Invalid relay number: {relay_num}")
+        return f"GET NAME {relay_num}{RelayProtocol.COMMAND_TERMINATOR}"
+
+    @staticmethod
+    def _encode_beep(*args) -> str:
+        if len(args) == 0:
+            return f"BEEP{RelayProtocol.COMMAND_TERMINATOR}"
+        if len(args) != 1:
+            raise RelayValidationError("BEEP command takes 0 or 1 parameters")
+        duration_ms = args[0]
+        if not isinstance(duration_ms, int) or not (
+            RelayProtocol.BEEP_MIN_DURATION
+            <= duration_ms
+            <= RelayProtocol.BEEP_MAX_DURATION
+        ):
+            raise RelayValidationError(
+                f"Invalid beep duration: {duration_ms} (must be {RelayProtocol.BEEP_MIN_DURATION}-{RelayProtocol.BEEP_MAX_DURATION}ms)"
+            )
+        return f"BEEP {duration_ms}{RelayProtocol.COMMAND_TERMINATOR}"
+
+    @staticmethod
+    def _check_tone(frequency, duration_ms) -> None:
+        """Raise RelayValidationError unless the TONE parameters are valid"""
+        if not isinstance(frequency, int) or not (
+            RelayProtocol.TONE_MIN_FREQUENCY
+            <= frequency
+            <= RelayProtocol.TONE_MAX_FREQUENCY
+        ):
+            raise RelayValidationError(
+                f"Invalid frequency: {frequency} (must be {RelayProtocol.TONE_MIN_FREQUENCY}-{RelayProtocol.TONE_MAX_FREQUENCY}Hz)"
+            )
+        if not isinstance(duration_ms, int) or not (
+            RelayProtocol.TONE_MIN_DURATION
+            <= duration_ms
+            <= RelayProtocol.TONE_MAX_DURATION
+        ):
+            raise RelayValidationError(
+                f"Invalid duration: {duration_ms} (must be {RelayProtocol.TONE_MIN_DURATION}-{RelayProtocol.TONE_MAX_DURATION}ms)"
+            )
+
+    @staticmethod
+    def _encode_tone(*args) -> str:
+        if len(args) != 2:
+            raise RelayValidationError("TONE command requires exactly two parameters")
+        frequency, duration_ms = args
+        RelayProtocol._check_tone(frequency, duration_ms)
+        return f"TONE {frequency} {duration_ms}{RelayProtocol.COMMAND_TERMINATOR}"
+
+    # Command name -> encoder, built once at class creation
+    _ENCODERS = {
+        "PING": _no_args("PING", COMMAND_TERMINATOR),
+        "ON": _relay_arg("ON", COMMAND_TERMINATOR, _VALID_RELAY_NUMS),
+        "OFF": _relay_arg("OFF", COMMAND_TERMINATOR, _VALID_RELAY_NUMS),
+        "STATUS": _no_args("STATUS", COMMAND_TERMINATOR),
+        "ALL": _on_off_arg("ALL", COMMAND_TERMINATOR, _ON_OFF),
+        "SET": _encode_set,
+        "PULSE": _encode_pulse,
+        "INFO": _no_args("INFO", COMMAND_TERMINATOR),
+        "UID": _no_args("UID", COMMAND_TERMINATOR),
+        "NAME": _encode_name,
+        "GET": _encode_get,
+        "BEEP": _encode_beep,
+        "BUZZ": _on_off_arg("BUZZ", COMMAND_TERMINATOR, _ON_OFF),
+        "TONE": _encode_tone,
+        "VERSION": _no_args("VERSION", COMMAND_TERMINATOR),
+        "HELP": _no_args("HELP", COMMAND_TERMINATOR),
+        "SAVE": _no_args("SAVE", COMMAND_TERMINATOR),
+        "LOAD": _no_args("LOAD", COMMAND_TERMINATOR),
+        "CLEAR": _no_args("CLEAR", COMMAND_TERMINATOR),
+    }
+
+    @staticmethod
+    def decode_response(response: str) -> tuple[bool, str | None, str | None]:
         """
         Decode a response from the relay board
 
@@ -274,7 +295,7 @@ class RelayProtocol:
         response = response.strip()
 
         # Check for error response
-        error_match = self.ERROR_PATTERN.match(response)
+        error_match = RelayProtocol.ERROR_PATTERN.match(response)
         if error_match:
             error_code = error_match.group(1)
             return False, None, error_code
@@ -291,7 +312,30 @@ class RelayProtocol:
             # Response with data
             return True, response, None
 
-    def parse_status_response(self, status_data: str) -> dict[int, bool]:
+    @staticmethod
+    def decode_response_bytes(response: bytes) -> tuple[bool, str | None, str | None]:
+        """
+        Decode a raw response line read from the relay board
+
+        Same result as decode_response(), but works on the bytes as read so
+        only the returned payload is decoded to str.
+
+        Args:
+            response: Raw response bytes, terminator included or not
+
+        Returns:
+            Tuple of (is_success, data, error_code)
+        """
+        response = response.strip()
+
+        if response.startswith(b"ERROR:") and len(response) > 6:
+            return False, None, response[6:].decode("utf-8")
+        if response == b"OK":
+            return True, None, None
+        return True, response.decode("utf-8"), None
+
+    @staticmethod
+    def parse_status_response(status_data: str) -> dict[int, bool]:
         """
         Parse STATUS command response into relay states
 
@@ -301,20 +345,18 @@ class RelayProtocol:
         Returns:
             Dict mapping relay numbers (1-8) to boolean states
         """
-        if not self.validate_binary_pattern(status_data):
+        if not RelayProtocol.validate_binary_pattern(status_data):
             raise RelayValidationError(f"Invalid status data: {status_data}")
 
         # Convert binary string to relay states
         # MSB = relay 8, LSB = relay 1
-        relay_states = {}
-        for i in range(8):
-            relay_num = i + 1
-            bit_position = 7 - i  # MSB first
-            relay_states[relay_num] = status_data[bit_position] == "1"
+        bits = int(status_data, 2)
+        return {
+            relay_num: bool(bits >> (relay_num - 1) & 1) for relay_num in range(1, 9)
+        }
 
-        return relay_states
-
-    def parse_info_response(self, info_data: str) -> dict[str, str]:
+    @staticmethod
+    def parse_info_response(info_data: str) -> dict[str, str]:
         """
         Parse INFO command response into structured data
 
@@ -325,16 +367,11 @@ class RelayProtocol:
             Dict with parsed information
         """
         # Expected format: "WAVESHARE-PICO-RELAY-B,V1.0,8CH,UID:xxxxx"
-        parts = info_data.split(",")
-        info = {}
-
-        if len(parts) >= 1:
-            info["board_name"] = parts[0]
-        if len(parts) >= 2:
-            info["version"] = parts[1]
-        if len(parts) >= 3:
-            info["channels"] = parts[2]
-        if len(parts) >= 4 and parts[3].startswith("UID:"):
-            info["uid"] = parts[3][4:]  # Remove 'UID:' prefix
+        info = dict(zip(RelayProtocol._INFO_KEYS, info_data.split(","), strict=False))
+
+        # Only keep the UID field when it carries the 'UID:' prefix
+        uid = info.pop("uid", "")
+        if uid.startswith("UID:"):
+            info["uid"] = uid[4:]
 
         return info
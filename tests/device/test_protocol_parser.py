@@ -0,0 +1,83 @@
+"""
+On-device protocol parser test.
+
+Exercises ProtocolParser parsing, validation and response formatting
+without a relay controller. Kept out of micropython/ so it is not deployed
+or imported on boot. Run it on a board that has the firmware installed:
+
+    mpremote run tests/device/test_protocol_parser.py
+"""
+
+from protocol import ProtocolParser
+
+
+def test_protocol_parser():
+    """
+    Test function for protocol parser.
+
+    Runs basic validation tests without hardware. Useful for verifying
+    protocol implementation during development.
+    """
+    print("=== PROTOCOL PARSER TEST ===")
+
+    # Create parser without relay controller for basic testing
+    parser = ProtocolParser()
+
+    # Test command parsing
+    test_commands = [
+        "PING",
+        "ping",
+        "STATUS",
+        "ON 1",
+        "OFF 5",
+        "on 8",
+        "off 3",
+        "INVALID",
+        "ON",
+        "OFF 9",
+        "ON abc",
+        "",
+        "  PING  ",
+    ]
+
+    print("Testing command parsing and validation:")
+    for cmd in test_commands:
+        print(f"\nCommand: '{cmd}'")
+        command, params = parser.parse_command(cmd)
+        print(f"  Parsed: command='{command}', params={params}")
+
+        if command:
+            is_valid, error, _ = parser.validate_command(command, params)
+            print(f"  Valid: {is_valid}, Error: {error}")
+
+    # Test response formatting
+    print("\nTesting response formatting:")
+    responses = [
+        parser.format_success_response(),
+        parser.format_success_response("PONG"),
+        parser.format_success_response("10101010"),
+        parser.format_error_response("INVALID_COMMAND"),
+        parser.format_error_response("INVALID_RELAY_NUMBER"),
+    ]
+
+    for resp in responses:
+        print(f"  Response: '{resp.strip()}'")
+
+    # Test command processing (without relay controller)
+    print("\nTesting command processing (no relay controller):")
+    test_cmds = ["PING", "STATUS", "ON 1", "INVALID"]
+    for cmd in test_cmds:
+        response = parser.process_command(cmd)
+        print(f"  '{cmd}' -> '{response.strip()}'")
+
+    # Show statistics
+    print("\nProtocol Statistics:")
+    stats = parser.get_statistics()
+    for key, value in stats.items():
+        print(f"  {key}: {value}")
+
+    print("\nProtocol parser test complete!")
+
+
+if __name__ == "__main__":
+    test_protocol_parser()